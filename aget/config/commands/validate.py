@@ -46,12 +46,17 @@ class ValidateCommand(BaseCommand):
             action='store_true',
             help='Quiet mode - only show errors'
         )
+        parser.add_argument(
+            '--no-cache',
+            action='store_true',
+            help='Revalidate every pattern, ignoring .aget/cache/validate.json'
+        )
 
         parsed_args = parser.parse_args(args or [])
 
         # Run validation
         project_path = Path(parsed_args.path)
-        validator = ProjectValidator(project_path)
+        validator = ProjectValidator(project_path, use_cache=not parsed_args.no_cache)
         is_valid = validator.validate_all()
 
         # Handle strict mode
@@ -10,19 +10,176 @@ Usage:
 """
 
 import os
+import re
 import sys
 import shutil
+import fnmatch
 from pathlib import Path
-from typing import List, Tuple, Set
+from typing import Dict, List, Optional, Tuple, Set
+
+# Name patterns bucketed by the single tree walk in HygieneChecker._scan_once
+ARTIFACT_PATTERNS = ["*.moved", "*.backup", "*.original", "*.old"]
+EDITOR_PATTERNS = ["*.swp", "*.swo", "*~", ".DS_Store"]
+# Directories the walk never descends into; __pycache__ is still reported
+WALK_SKIP = {".git", "__pycache__", ".venv", "node_modules"}
+EMPTY_DIR_SKIP = {".git", "__pycache__"}
+
+# Patterns that suggest private information in README files
+PRIVACY_PATTERNS = [
+    r'my-[A-Z]+-aget',  # Private agent names
+    r'/Users/[^/]+/',   # Personal file paths
+    r'gabormelli',      # Specific username (except in LICENSE)
+    r'my-.*-aget.*v2\.',  # Version info with private agents
+]
+PRIVACY_RES = {p: re.compile(p, re.IGNORECASE) for p in PRIVACY_PATTERNS}
+LICENSE_RE = re.compile("LICENSE")
+
+SCAN_CHUNK_SIZE = 65536
+
+
+def _scan_privacy(path: Path, regexes: Dict[str, "re.Pattern"], overlap: int = 128) -> Set[str]:
+    """Return the keys of regexes that match in path, read in 64 KB chunks.
+
+    The unfinished last line of each chunk (at least ``overlap`` chars) is
+    carried into the next window so matches straddling a boundary still fire.
+    Reading stops as soon as every regex has matched.
+    """
+    found = set()
+    pending = dict(regexes)
+    carry = ""
+
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        while pending:
+            chunk = f.read(SCAN_CHUNK_SIZE)
+            if not chunk:
+                break
+            window = carry + chunk
+            for key, regex in list(pending.items()):
+                if regex.search(window):
+                    found.add(key)
+                    del pending[key]
+            start = min(window.rfind("\n") + 1, len(window) - overlap)
+            carry = window[max(start, len(window) - SCAN_CHUNK_SIZE, 0):]
+
+    return found
+
 
 class HygieneChecker:
     """Checks and fixes release hygiene issues"""
 
+    __slots__ = ("root", "issues", "warnings", "fixed", "_root_str",
+                 "_root_prefix_len", "_scanned", "_dir_fp", "_dir_listing")
+
     def __init__(self, root_path: Path = None):
         self.root = root_path or Path.cwd()
         self.issues = []
         self.warnings = []
         self.fixed = []
+        # Every scanned path starts with the root, so relative paths are slices
+        self._root_str = os.fspath(self.root)
+        self._root_prefix_len = len(os.path.join(self._root_str, ""))
+        self._scanned = None
+        # Per-directory (st_mtime_ns, st_nlink) fingerprint and listing, kept
+        # across runs so the re-check after --fix only re-reads touched dirs
+        self._dir_fp: Dict[str, Optional[Tuple[int, int]]] = {}
+        self._dir_listing: Dict[str, List[Tuple[str, bool]]] = {}
+
+    def _list_dir(self, dirpath: str) -> List[Tuple[str, bool]]:
+        """Return (name, is_dir) pairs, reusing the cached listing if unchanged"""
+        try:
+            st = os.stat(dirpath)
+        except OSError:
+            return []
+        fp = (st.st_mtime_ns, st.st_nlink)
+        if self._dir_fp.get(dirpath) == fp:
+            return self._dir_listing[dirpath]
+
+        try:
+            with os.scandir(dirpath) as it:
+                listing = [(e.name, e.is_dir(follow_symlinks=False)) for e in it]
+        except OSError:
+            return []
+        self._dir_fp[dirpath] = fp
+        self._dir_listing[dirpath] = listing
+        return listing
+
+    def _rel(self, path) -> str:
+        """Return path relative to the root by slicing off the root prefix"""
+        s = os.fspath(path)
+        if s == self._root_str:
+            return "."
+        if s.startswith(self._root_str):
+            return s[self._root_prefix_len:]
+        return s
+
+    def _root_names(self) -> Set[str]:
+        """Names directly under the root, from one (cached) directory listing"""
+        return {name for name, _ in self._list_dir(self._root_str)}
+
+    def _invalidate(self, path: Path):
+        """Drop the cached listing of the directory containing path"""
+        self._dir_fp[os.fspath(path.parent)] = None
+
+    def _scan_once(self) -> dict:
+        """Walk the tree once and bucket every entry the checks look at"""
+        if self._scanned is not None:
+            return self._scanned
+
+        buckets = {
+            "artifacts": {p: [] for p in ARTIFACT_PATTERNS + EDITOR_PATTERNS},
+            "pycache": [],
+            "pyc": [],
+            "py": [],
+            "readme": [],
+            "empty_dirs": [],
+        }
+        self._walk(self._root_str, buckets)
+        self._scanned = buckets
+        return buckets
+
+    def _walk(self, dirpath: str, buckets: dict, skip: Set[str] = WALK_SKIP):
+        """Pre-order traversal matching the order rglob/os.walk report in.
+
+        Entries are classified from the cached d_type of the listing and a
+        Path is only built for names that land in a bucket. Directories in
+        skip are bucketed by name but never descended into.
+        """
+        listing = self._list_dir(dirpath)
+        artifacts = buckets["artifacts"]
+        subdirs = []
+        has_content = False
+
+        for name, is_dir in listing:
+            path = None
+            for pattern, matches in artifacts.items():
+                if fnmatch.fnmatch(name, pattern):
+                    path = path or Path(dirpath, name)
+                    matches.append(path)
+            if name == "__pycache__":
+                buckets["pycache"].append(path or Path(dirpath, name))
+
+            if is_dir:
+                if name not in skip:
+                    subdirs.append(name)
+                if name not in EMPTY_DIR_SKIP:
+                    has_content = True
+                continue
+
+            has_content = True
+            if name.endswith(".pyc"):
+                buckets["pyc"].append(path or Path(dirpath, name))
+            if name.endswith(".py"):
+                buckets["py"].append(path or Path(dirpath, name))
+            if name == "README.md":
+                buckets["readme"].append(path or Path(dirpath, name))
+
+        # The root itself is never reported (its relative path is empty)
+        rel_path = dirpath[self._root_prefix_len:]
+        if not has_content and rel_path:
+            buckets["empty_dirs"].append(rel_path)
+
+        for name in subdirs:
+            self._walk(os.path.join(dirpath, name), buckets, skip)
 
     def check_root_cleanliness(self) -> bool:
         """Check if root directory is clean and organized"""
@@ -67,10 +224,12 @@ class HygieneChecker:
     def check_artifacts(self) -> bool:
         """Check for development artifacts that shouldn't be in release"""
         found_artifacts = False
+        scan = self._scan_once()
+        root_names = self._root_names()
 
         # Migration artifacts
-        for pattern in ["*.moved", "*.backup", "*.original", "*.old"]:
-            artifacts = list(self.root.rglob(pattern))
+        for pattern in ARTIFACT_PATTERNS:
+            artifacts = scan["artifacts"][pattern]
             if artifacts:
                 self.issues.append(
                     f"Migration artifacts ({pattern}): {len(artifacts)} files"
@@ -78,24 +237,23 @@ class HygieneChecker:
                 found_artifacts = True
 
         # Python cache
-        pycache = list(self.root.rglob("__pycache__"))
+        pycache = scan["pycache"]
         if pycache:
             self.issues.append(f"Python cache: {len(pycache)} __pycache__ directories")
             found_artifacts = True
 
-        pyc_files = list(self.root.rglob("*.pyc"))
+        pyc_files = scan["pyc"]
         if pyc_files:
             self.issues.append(f"Compiled Python: {len(pyc_files)} .pyc files")
             found_artifacts = True
 
-        pytest_cache = self.root / ".pytest_cache"
-        if pytest_cache.exists():
+        if ".pytest_cache" in root_names:
             self.issues.append("Pytest cache: .pytest_cache directory exists")
             found_artifacts = True
 
         # Editor artifacts
-        for pattern in ["*.swp", "*.swo", "*~", ".DS_Store"]:
-            editor_files = list(self.root.rglob(pattern))
+        for pattern in EDITOR_PATTERNS:
+            editor_files = scan["artifacts"][pattern]
             if editor_files:
                 self.warnings.append(
                     f"Editor artifacts ({pattern}): {len(editor_files)} files"
@@ -111,8 +269,7 @@ class HygieneChecker:
             "products"
         ]
         for artifact in session_artifacts:
-            path = self.root / artifact
-            if path.exists():
+            if artifact in root_names:
                 self.issues.append(f"Session artifact: {artifact}")
                 found_artifacts = True
 
@@ -123,15 +280,13 @@ class HygieneChecker:
         py_files = {}
         has_duplicates = False
 
-        for f in self.root.rglob("*.py"):
-            if "__pycache__" in str(f):
-                continue
+        for f in self._scan_once()["py"]:
             name = f.name
             if name in py_files:
                 self.warnings.append(
                     f"Duplicate file: {name} in:\n"
-                    f"  - {f.parent.relative_to(self.root)}\n"
-                    f"  - {py_files[name].relative_to(self.root)}"
+                    f"  - {self._rel(f.parent)}\n"
+                    f"  - {self._rel(py_files[name])}"
                 )
                 has_duplicates = True
             else:
@@ -150,8 +305,9 @@ class HygieneChecker:
         }
 
         missing = []
+        root_names = self._root_names()
         for file, description in essential.items():
-            if not (self.root / file).exists():
+            if file not in root_names:
                 self.issues.append(f"Missing {description}: {file}")
                 missing.append(file)
 
@@ -186,26 +342,20 @@ class HygieneChecker:
     def check_readme_privacy(self) -> bool:
         """Check README files for privacy violations"""
         privacy_issues = []
+        regexes = dict(PRIVACY_RES, LICENSE=LICENSE_RE)
 
-        # Patterns that suggest private information
-        private_patterns = [
-            r'my-[A-Z]+-aget',  # Private agent names
-            r'/Users/[^/]+/',   # Personal file paths
-            r'gabormelli',      # Specific username (except in LICENSE)
-            r'my-.*-aget.*v2\.',  # Version info with private agents
-        ]
-
-        readme_files = list(self.root.rglob("README.md"))
+        readme_files = self._scan_once()["readme"]
         for readme in readme_files:
             if "LICENSE" in str(readme):
                 continue
 
-            content = readme.read_text()
-            for pattern in private_patterns:
-                import re
-                if re.search(pattern, content, re.IGNORECASE):
-                    if not (pattern == r'gabormelli' and 'LICENSE' in content):
-                        privacy_issues.append(f"Privacy concern in {readme.name}: pattern '{pattern}'")
+            found = _scan_privacy(readme, regexes)
+            # The username is expected wherever license text is quoted
+            if "LICENSE" in found:
+                found.discard(r'gabormelli')
+            for pattern in PRIVACY_PATTERNS:
+                if pattern in found:
+                    privacy_issues.append(f"Privacy concern in {readme.name}: pattern '{pattern}'")
 
         if privacy_issues:
             self.warnings.extend(privacy_issues)
@@ -214,16 +364,8 @@ class HygieneChecker:
 
     def check_empty_directories(self) -> bool:
         """Check for empty directories that might be unnecessary"""
-        empty_dirs = []
-
-        for root, dirs, files in os.walk(self.root):
-            # Skip .git and __pycache__
-            dirs[:] = [d for d in dirs if d not in [".git", "__pycache__"]]
-
-            path = Path(root)
-            if not dirs and not files and path != self.root:
-                rel_path = path.relative_to(self.root)
-                empty_dirs.append(str(rel_path))
+        # .git and __pycache__ are neither descended into nor counted
+        empty_dirs = self._scan_once()["empty_dirs"]
 
         if empty_dirs:
             self.warnings.append(
@@ -234,8 +376,9 @@ class HygieneChecker:
 
     def run_all_checks(self) -> Tuple[bool, int, int]:
         """Run all hygiene checks"""
-        self.issues = []
-        self.warnings = []
+        self.issues.clear()
+        self.warnings.clear()
+        self._scanned = None
 
         checks = [
             ("Root cleanliness", self.check_root_cleanliness),
@@ -268,22 +411,26 @@ class HygieneChecker:
     def auto_clean(self, dry_run: bool = True) -> List[str]:
         """Automatically clean fixable issues"""
         actions = []
+        scan = self._scan_once()
 
         print("\n🔧 Cleaning fixable issues...")
         print("-" * 40)
 
         # Clean Python cache
-        for cache_dir in self.root.rglob("__pycache__"):
-            action = f"Remove {cache_dir.relative_to(self.root)}"
+        for cache_dir in scan["pycache"]:
+            action = f"Remove {self._rel(cache_dir)}"
             actions.append(action)
             if not dry_run:
                 shutil.rmtree(cache_dir, ignore_errors=True)
+                self._invalidate(cache_dir)
 
-        for pyc in self.root.rglob("*.pyc"):
-            action = f"Remove {pyc.relative_to(self.root)}"
+        # Stray .pyc files outside __pycache__
+        for pyc in scan["pyc"]:
+            action = f"Remove {self._rel(pyc)}"
             actions.append(action)
             if not dry_run:
                 pyc.unlink(missing_ok=True)
+                self._invalidate(pyc)
 
         # Remove pytest cache
         pytest_cache = self.root / ".pytest_cache"
@@ -292,15 +439,16 @@ class HygieneChecker:
             actions.append(action)
             if not dry_run:
                 shutil.rmtree(pytest_cache, ignore_errors=True)
+                self._invalidate(pytest_cache)
 
         # Clean artifacts
-        artifact_patterns = ["*.moved", "*.backup", "*.original", "*.old"]
-        for pattern in artifact_patterns:
-            for file in self.root.rglob(pattern):
-                action = f"Remove {file.relative_to(self.root)}"
+        for pattern in ARTIFACT_PATTERNS:
+            for file in scan["artifacts"][pattern]:
+                action = f"Remove {self._rel(file)}"
                 actions.append(action)
                 if not dry_run:
                     file.unlink(missing_ok=True)
+                    self._invalidate(file)
 
         # Remove session artifacts
         session_items = [
@@ -321,6 +469,7 @@ class HygieneChecker:
                         shutil.rmtree(path, ignore_errors=True)
                     else:
                         path.unlink(missing_ok=True)
+                    self._invalidate(path)
 
         # Move test files to tests/
         tests_dir = self.root / "tests"
@@ -330,6 +479,8 @@ class HygieneChecker:
                 actions.append(action)
                 if not dry_run:
                     test_file.rename(tests_dir / test_file.name)
+                    self._invalidate(test_file)
+                    self._invalidate(tests_dir / test_file.name)
 
         if dry_run:
             print(f"Would perform {len(actions)} cleaning actions (use --fix to apply)")
@@ -351,6 +502,12 @@ class HygieneChecker:
         return max(0, score)
 
 
+def _print_bullets(items: List[str]):
+    """Emit a bulleted list with a single stdout write"""
+    sys.stdout.write("".join(f"  • {item}\n" for item in items))
+    sys.stdout.flush()
+
+
 def main():
     import argparse
 
@@ -385,21 +542,18 @@ def main():
 
     if checker.issues:
         print(f"\n❌ Issues Found ({issue_count}):")
-        for issue in checker.issues:
-            print(f"  • {issue}")
+        _print_bullets(checker.issues)
 
     if checker.warnings:
         print(f"\n⚠️  Warnings ({warning_count}):")
-        for warning in checker.warnings:
-            print(f"  • {warning}")
+        _print_bullets(checker.warnings)
 
     # Auto-fix if requested
     if args.fix and checker.issues:
         actions = checker.auto_clean(dry_run=False)
         if actions:
             print("\n✅ Fixed:")
-            for action in actions:
-                print(f"  • {action}")
+            _print_bullets(actions)
 
             # Re-run checks after fixing
             print("\n🔄 Re-checking after fixes...")
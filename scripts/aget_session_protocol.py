@@ -10,11 +10,21 @@ All patterns must be installed locally, no parent directory references
 import os
 import sys
 import json
+import shlex
+import shutil
+import atexit
+import hashlib
 import subprocess
 import time
+from collections import defaultdict, namedtuple
 from datetime import datetime, timedelta
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # ANSI color codes
 BLUE = '\033[94m'
 GREEN = '\033[92m'
@@ -23,93 +33,381 @@ RED = '\033[91m'
 BOLD = '\033[1m'
 RESET = '\033[0m'
 
+# Resolve git once per process rather than searching PATH on every call
+_GIT = shutil.which('git') or 'git'
+
+
+def _json_loads(data):
+    """Parse JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_load(path):
+    """Parse a JSON file, using orjson when it is installed"""
+    return _json_loads(Path(path).read_bytes())
+
+
+def _json_dumps(obj, indent=False):
+    """Serialize obj to JSON bytes (compact unless indent), orjson if available"""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, default=str, option=option)
+    if indent:
+        return json.dumps(obj, indent=2, default=str).encode()
+    return json.dumps(obj, separators=(',', ':'), default=str).encode()
+
+
+def _json_dump(obj, path, indent=False):
+    """Write obj to path as JSON (compact unless indent), orjson if available"""
+    Path(path).write_bytes(_json_dumps(obj, indent=indent))
+
+
+def _digest(payload):
+    """Short fingerprint used to tell whether serialized state changed"""
+    return hashlib.blake2b(payload, digest_size=8).digest()
+
+
+# Static state schema; _fresh_session swaps the () placeholders for new lists
+_DEFAULT_STATE = {
+    'last_wake': None,
+    'last_wind_down': None,
+    'session_count': 0,
+    'total_commits': 0,
+}
+_DEFAULT_SESSION = {
+    'start_time': None,
+    'tasks_completed': (),
+    'files_modified': (),
+    'tests_run': 0,
+}
+
+
+def _fresh_session(loaded=None):
+    """Session dict with defaults (new lists) overlaid by any loaded keys"""
+    session = {**_DEFAULT_SESSION, **(loaded or {})}
+    for key in ('tasks_completed', 'files_modified'):
+        if session[key] == ():
+            session[key] = []
+    return session
+
 
 class SessionState:
     """Manage persistent session state"""
 
+    STATE_FILE = Path('.session_state.json')
+
     def __init__(self):
-        self.state_file = Path('.session_state.json')
+        self.state_file = self.STATE_FILE
+        # Digest of what is on disk; save() skips identical rewrites
+        self._last_hash = None
+        # (start_time string, parsed datetime) so it is parsed only once
+        self._start = (None, None)
         self.state = self.load()
 
     def load(self):
         """Load session state from disk"""
         if self.state_file.exists():
             try:
-                with open(self.state_file, 'r') as f:
-                    loaded_state = json.load(f)
-                    # Ensure all required keys exist
-                    default = self.default_state()
-                    for key in default:
-                        if key not in loaded_state:
-                            loaded_state[key] = default[key]
-                    # Ensure current_session has all required keys
-                    if 'current_session' in loaded_state:
-                        for key in default['current_session']:
-                            if key not in loaded_state['current_session']:
-                                loaded_state['current_session'][key] = default['current_session'][key]
-                    return loaded_state
+                data = self.state_file.read_bytes()
+                loaded_state = _json_loads(data)
+                self._last_hash = _digest(data)
+                # Backfill missing keys with one C-level dict merge per level
+                merged = {**_DEFAULT_STATE, **loaded_state}
+                merged['current_session'] = _fresh_session(merged.get('current_session'))
+                return merged
             except (json.JSONDecodeError, IOError):
                 return self.default_state()
         return self.default_state()
 
     def default_state(self):
         """Return default state structure"""
-        return {
-            'last_wake': None,
-            'last_wind_down': None,
-            'session_count': 0,
-            'total_commits': 0,
-            'current_session': {
-                'start_time': None,
-                'tasks_completed': [],
-                'files_modified': [],
-                'tests_run': 0
-            }
-        }
+        return {**_DEFAULT_STATE, 'current_session': _fresh_session()}
 
     def save(self):
         """Save session state to disk"""
         try:
-            with open(self.state_file, 'w') as f:
-                json.dump(self.state, f, indent=2, default=str)
+            # Machine-read only, so keep it compact
+            payload = _json_dumps(self.state)
+            digest = _digest(payload)
+            if digest == self._last_hash:
+                return
+            self.state_file.write_bytes(payload)
+            self._last_hash = digest
         except IOError as e:
             print(f"{YELLOW}⚠ Could not save session state: {e}{RESET}")
 
-    def start_session(self):
-        """Mark session start"""
-        self.state['last_wake'] = datetime.now().isoformat()
+    def start_session(self, now=None):
+        """Mark session start (at now, defaulting to the current time)"""
+        now_iso = (now or datetime.now()).isoformat()
+        self.state['last_wake'] = now_iso
         self.state['session_count'] += 1
         self.state['current_session'] = {
-            'start_time': datetime.now().isoformat(),
+            'start_time': now_iso,
             'tasks_completed': [],
             'files_modified': [],
-            'tests_run': 0
+            'tests_run': 0,
+            # Scanned once per session; wind_down reuses it unless it changed
+            'patterns_snapshot': scan_patterns()
         }
         self.save()
 
-    def end_session(self):
-        """Mark session end"""
-        self.state['last_wind_down'] = datetime.now().isoformat()
-        self.state['current_session']['end_time'] = datetime.now().isoformat()
+    def end_session(self, now=None):
+        """Mark session end (at now, defaulting to the current time)"""
+        now_iso = (now or datetime.now()).isoformat()
+        self.state['last_wind_down'] = now_iso
+        self.state['current_session']['end_time'] = now_iso
         self.save()
 
+    @classmethod
+    def load_readonly(cls):
+        """Return the raw state dict from disk, without backfilling defaults
+
+        For read-only paths that only print a few fields; missing or corrupt
+        state reads as an empty dict.
+        """
+        try:
+            return _json_load(cls.STATE_FILE)
+        except (ValueError, IOError):
+            return {}
+
     def get_session_duration(self):
         """Get current session duration"""
-        if self.state['current_session']['start_time']:
-            start = datetime.fromisoformat(self.state['current_session']['start_time'])
-            return str(datetime.now() - start).split('.')[0]
-        return "Unknown"
+        start_time = self.state['current_session']['start_time']
+        if not start_time:
+            return "Unknown"
+        if self._start[0] != start_time:
+            self._start = (start_time, datetime.fromisoformat(start_time))
+        return format_elapsed(datetime.now() - self._start[1])
+
 
+def format_elapsed(delta):
+    """Format a timedelta as H:MM:SS (hours may exceed 24), dropping fractions"""
+    secs = max(int(delta.total_seconds()), 0)
+    return f"{secs // 3600}:{secs // 60 % 60:02d}:{secs % 60:02d}"
 
-def run_command(cmd, check=False):
-    """Run command and return output"""
+
+def session_duration(start_time):
+    """Elapsed time since the ISO start_time, or "Unknown" if not started"""
+    if start_time:
+        return format_elapsed(datetime.now() - datetime.fromisoformat(start_time))
+    return "Unknown"
+
+
+_STATE = None
+
+
+def get_state():
+    """Return the process-wide SessionState, loading it on first use
+
+    Protocols chained in one process share the parsed state instead of
+    re-reading the file; pending changes are written once at exit.
+    """
+    global _STATE
+    if _STATE is None:
+        _STATE = SessionState()
+        atexit.register(_STATE.save)
+    return _STATE
+
+
+def peek_state():
+    """Current state dict for read-only use, without loading a SessionState
+
+    Reuses the in-process state if a protocol already loaded it, so unsaved
+    changes are visible; otherwise reads the file and nothing is saved back.
+    """
+    if _STATE is not None:
+        return _STATE.state
+    return SessionState.load_readonly()
+
+
+def run_command(argv, check=False):
+    """Run argv (a list, no shell) and return its stripped output
+
+    A plain string is still accepted and split with shlex for older callers,
+    but pass a list: nothing is shell-interpreted either way.
+    """
+    if isinstance(argv, str):
+        argv = shlex.split(argv)
     try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True, check=check)
+        result = subprocess.run(argv, capture_output=True, text=True, check=check)
         return result.stdout.strip()
     except subprocess.CalledProcessError:
         return None
 
 
+def git(*args, input=None, merge_stderr=False, strip=True):
+    """Run git with an argv list and return its stripped output
+
+    No shell is involved, so arguments (e.g. commit messages passed on stdin
+    via `-F -`) need no quoting. merge_stderr folds stderr into the result,
+    as `2>&1` did, for commands like push that report on stderr. strip=False
+    keeps the output verbatim (for NUL-separated `-z` output).
+    """
+    try:
+        result = subprocess.run(
+            (_GIT,) + args, input=input, text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT if merge_stderr else subprocess.PIPE
+        )
+    except OSError:
+        return ''
+    return result.stdout.strip() if strip else result.stdout
+
+
+# Ref status flags in `git push --porcelain` output
+PUSH_FLAGS = (' ', '+', '-', '*', '=', '!')
+
+GitSnapshot = namedtuple('GitSnapshot', ['branch', 'ahead', 'behind', 'changed_files'])
+
+
+def git_snapshot():
+    """Branch, ahead/behind counts and changed files from a single git call
+
+    Parses `git status -z --porcelain=v2 --branch`; entries are NUL-separated
+    so paths containing newlines survive intact. Outside a repository (or
+    without git) this is an empty snapshot, like the old `git status --short`.
+    """
+    out = git("status", "-z", "--porcelain=v2", "--branch", "--untracked-files=all", strip=False)
+
+    branch, ahead, behind, changed_files = '', 0, 0, []
+    fields = iter(out.split('\0'))
+    for line in fields:
+        if line.startswith('# branch.head '):
+            head = line[len('# branch.head '):]
+            branch = '' if head == '(detached)' else head
+        elif line.startswith('# branch.ab '):
+            ab = line[len('# branch.ab '):].split()
+            ahead, behind = int(ab[0]), abs(int(ab[1]))
+        elif line.startswith('1 '):
+            changed_files.append(line.split(' ', 8)[8])
+        elif line.startswith('2 '):
+            changed_files.append(line.split(' ', 9)[9])
+            next(fields, None)  # the rename/copy source path
+        elif line.startswith('u '):
+            changed_files.append(line.split(' ', 10)[10])
+        elif line.startswith('? '):
+            changed_files.append(line[2:])
+
+    return GitSnapshot(branch, ahead, behind, changed_files)
+
+
+def git_status_head(n=10):
+    """Count changed paths and return (count, first n paths), streaming output
+
+    Reads `git status -z --porcelain` from a pipe in chunks and counts NUL
+    separated entries, so only the first n paths are ever decoded and kept.
+    """
+    try:
+        proc = subprocess.Popen(
+            [_GIT, "status", "-z", "--porcelain"],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        )
+    except OSError:
+        return 0, []
+
+    count, entries, buf, skip_next = 0, [], b'', False
+    with proc:
+        while True:
+            chunk = proc.stdout.read1(65536)
+            if not chunk:
+                break
+            *done, buf = (buf + chunk).split(b'\0')
+            for entry in done:
+                if skip_next:
+                    # Source path of a rename/copy, not a separate change
+                    skip_next = False
+                    continue
+                skip_next = entry[:1] in (b'R', b'C')
+                count += 1
+                if len(entries) < n:
+                    entries.append(entry[3:].decode(errors='replace'))
+    return count, entries
+
+
+def _subdir_names(path):
+    """Names of the non-hidden subdirectories of path, via a single scandir"""
+    try:
+        with os.scandir(path) as it:
+            return [e.name for e in it if e.is_dir() and not e.name.startswith('.')]
+    except OSError:
+        return []
+
+
+def _mtime_ns(path):
+    """Modification time of path in ns, or None if it can't be stat'd"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def scan_patterns(patterns_dir='patterns', cached=None):
+    """Snapshot of the patterns tree: pattern names and '<pattern>/<script>.py'
+
+    Equivalent to listing patterns_dir plus glob('*/*.py'), in one scandir
+    pass per level. A cached snapshot is returned as-is while the mtimes of
+    patterns_dir and its pattern directories are unchanged.
+    """
+    if cached and cached.get('mtimes') == [_mtime_ns(patterns_dir)] + [
+            _mtime_ns(os.path.join(patterns_dir, name)) for name in cached.get('names', [])]:
+        return cached
+
+    names, scripts = [], []
+    try:
+        with os.scandir(patterns_dir) as top:
+            pattern_dirs = [e for e in top if e.is_dir() and not e.name.startswith('.')]
+    except OSError:
+        pattern_dirs = []
+
+    for pattern_dir in pattern_dirs:
+        names.append(pattern_dir.name)
+        try:
+            with os.scandir(pattern_dir.path) as it:
+                scripts.extend(
+                    (pattern_dir.name, e.name) for e in it
+                    if e.name.endswith('.py') and not e.name.startswith('.')
+                )
+        except OSError:
+            pass
+
+    names.sort()
+    return {
+        'mtimes': [_mtime_ns(patterns_dir)] + [
+            _mtime_ns(os.path.join(patterns_dir, name)) for name in names],
+        'names': names,
+        'scripts': [os.path.join(pattern, script) for pattern, script in sorted(scripts)],
+    }
+
+
+def _move_into(target_dir, entries):
+    """Move scandir entries into target_dir, leaving any that already exist there"""
+    try:
+        os.mkdir(target_dir)
+        existing = set()
+    except FileExistsError:
+        existing = None
+    except OSError:
+        return
+
+    if existing is None:
+        # Listed outside the handler above, so its errors are caught here
+        try:
+            existing = set(os.listdir(target_dir))
+        except OSError:
+            return
+
+    for entry in entries:
+        if entry.name in existing:
+            continue
+        try:
+            os.replace(entry.path, os.path.join(target_dir, entry.name))
+        except OSError:
+            # Skip entries that can't be moved
+            pass
+
+
 def organize_session_notes():
     """Organize SESSION_NOTES into dated subdirectories"""
     session_dir = Path('SESSION_NOTES')
@@ -117,57 +415,52 @@ def organize_session_notes():
         session_dir.mkdir(parents=True)
         return
 
-    # Move flat session files into dated directories
-    for session_file in session_dir.glob('session_*.md'):
-        if session_file.is_file():
-            # Extract date from filename (session_YYYYMMDD_HHMM.md)
-            try:
-                parts = session_file.stem.split('_')
+    # Group flat session files by target date (session_YYYYMMDD_HHMM.md)
+    buckets = defaultdict(list)
+    with os.scandir(session_dir) as it:
+        for e in it:
+            if e.name.startswith('session_') and e.name.endswith('.md') and e.is_file():
+                parts = e.name[:-3].split('_')
                 if len(parts) >= 2:
                     date_str = parts[1]
                     if len(date_str) >= 8 and date_str[:8].isdigit():
-                        year = date_str[:4]
-                        month = date_str[4:6]
-                        day = date_str[6:8]
-                        date_dir = session_dir / f"{year}-{month}-{day}"
-                        date_dir.mkdir(exist_ok=True)
-
-                        # Move file to dated directory
-                        new_path = date_dir / session_file.name
-                        if not new_path.exists():
-                            session_file.rename(new_path)
-            except (IndexError, ValueError, OSError):
-                # Skip files that don't match expected format or can't be moved
-                pass
+                        buckets[f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"].append(e)
+
+    # One mkdir and listing per date, then move each file into place
+    for date, entries in buckets.items():
+        _move_into(session_dir / date, entries)
 
     # Archive old sessions (>30 days)
-    archive_dir = session_dir / 'archive'
     cutoff = datetime.now() - timedelta(days=30)
 
-    for date_dir in session_dir.glob('????-??-??'):
-        if date_dir.is_dir():
-            try:
-                dir_date = datetime.strptime(date_dir.name, '%Y-%m-%d')
-                if dir_date < cutoff:
-                    archive_dir.mkdir(exist_ok=True)
-                    archive_target = archive_dir / date_dir.name
-                    if not archive_target.exists():
-                        date_dir.rename(archive_target)
-            except ValueError:
-                pass
+    # Dated directories are named YYYY-MM-DD
+    old_dirs = []
+    with os.scandir(session_dir) as it:
+        for e in it:
+            if len(e.name) == 10 and e.name[4] == '-' and e.name[7] == '-' and e.is_dir():
+                try:
+                    if datetime.strptime(e.name, '%Y-%m-%d') < cutoff:
+                        old_dirs.append(e)
+                except ValueError:
+                    pass
+
+    if old_dirs:
+        _move_into(session_dir / 'archive', old_dirs)
 
 
 def wake():
     """Wake up protocol - Initialize session with state management"""
-    state = SessionState()
-    state.start_session()
+    # One timestamp for the whole run keeps state and output consistent
+    now = datetime.now()
+    state = get_state()
+    state.start_session(now)
 
-    print(f"{BOLD}{BLUE}## Wake Up - {datetime.now():%Y-%m-%d %H:%M}{RESET}")
+    print(f"{BOLD}{BLUE}## Wake Up - {now:%Y-%m-%d %H:%M}{RESET}")
 
     # Show session info
     if state.state['last_wake']:
         last_wake = datetime.fromisoformat(state.state['last_wake'])
-        time_since = str(datetime.now() - last_wake).split('.')[0]
+        time_since = format_elapsed(now - last_wake)
         print(f"📅 Last session: {time_since} ago")
     print(f"🔢 Session #{state.state['session_count']}")
 
@@ -176,33 +469,23 @@ def wake():
     print(f"📍 {cwd}")
 
     # Check git status
-    git_status = run_command("git status --short")
-    if git_status:
-        change_count = len(git_status.split('\n'))
+    change_count, first_files = git_status_head()
+    if change_count:
         print(f"🔄 {change_count} uncommitted changes")
-        # Track modified files
-        state.state['current_session']['files_modified'] = git_status.split('\n')
+        # Track modified files (the note lists the first 10)
+        state.state['current_session']['files_modified'] = first_files
+        state.state['current_session']['files_modified_count'] = change_count
     else:
         print(f"{GREEN}✓ Git repository clean{RESET}")
 
     # Check pattern status (improved detection)
-    patterns_dir = cwd / 'patterns'
-    patterns_found = []
-    if patterns_dir.exists():
-        for pattern_dir in patterns_dir.iterdir():
-            if pattern_dir.is_dir() and not pattern_dir.name.startswith('.'):
-                patterns_found.append(pattern_dir.name)
+    patterns_found = state.state['current_session']['patterns_snapshot']['names']
 
     if patterns_found:
-        print(f"📦 Patterns available: {', '.join(sorted(patterns_found))}")
+        print(f"📦 Patterns available: {', '.join(patterns_found)}")
 
     # Check templates
-    templates_dir = cwd / 'templates'
-    templates_found = []
-    if templates_dir.exists():
-        for template_dir in templates_dir.iterdir():
-            if template_dir.is_dir() and not template_dir.name.startswith('.'):
-                templates_found.append(template_dir.name)
+    templates_found = _subdir_names(cwd / 'templates')
 
     if templates_found:
         print(f"📄 Templates: {', '.join(sorted(templates_found))}")
@@ -216,28 +499,28 @@ def wake():
     organize_session_notes()
 
     print(f"{GREEN}✅ Ready for tasks.{RESET}")
-    state.save()
 
 
 def wind_down():
     """Wind down protocol - Save session state"""
-    state = SessionState()
+    now = datetime.now()
+    now_disp = now.strftime('%Y-%m-%d %H:%M')
+    state = get_state()
 
-    print(f"{BOLD}{BLUE}## Wind Down - {datetime.now():%Y-%m-%d %H:%M}{RESET}")
+    print(f"{BOLD}{BLUE}## Wind Down - {now_disp}{RESET}")
     print(f"⏱ Session duration: {state.get_session_duration()}")
 
     # Check for uncommitted changes
-    git_status = run_command("git status --short")
+    git_status = git_snapshot().changed_files
 
     if git_status:
         print("📝 Committing changes...")
-        run_command("git add -A")
+        git("add", "-A")
 
         # Create commit message
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
-        commit_msg = f"session: Wind down at {timestamp}"
+        commit_msg = f"session: Wind down at {now_disp}"
 
-        run_command(f'git commit -m "{commit_msg}"')
+        git("commit", "-F", "-", input=commit_msg)
         print(f"{GREEN}✓ Changes committed{RESET}")
         state.state['total_commits'] += 1
     else:
@@ -246,7 +529,7 @@ def wind_down():
     # Run tests if they exist
     if Path('tests').exists():
         print("🧪 Running tests...")
-        result = run_command("python -m pytest tests/ -q")
+        result = run_command([sys.executable, "-m", "pytest", "tests/", "-q"])
         if result:
             print(f"{GREEN}✓ Tests passed{RESET}")
             state.state['current_session']['tests_run'] += 1
@@ -255,35 +538,39 @@ def wind_down():
 
     # Create session note in dated directory
     session_dir = Path('SESSION_NOTES')
-    date_str = datetime.now().strftime('%Y-%m-%d')
+    date_str = now.strftime('%Y-%m-%d')
     date_dir = session_dir / date_str
     date_dir.mkdir(parents=True, exist_ok=True)
 
-    session_file = date_dir / f"session_{datetime.now():%H%M}.md"
-    with open(session_file, 'w') as f:
-        f.write(f"# Session Notes - {datetime.now():%Y-%m-%d %H:%M}\n\n")
-        f.write(f"## Metadata\n")
-        f.write(f"- Duration: {state.get_session_duration()}\n")
-        f.write(f"- Session #: {state.state['session_count']}\n")
-        f.write(f"- Working directory: {Path.cwd()}\n")
-        f.write(f"- Git status: {'Clean' if not git_status else 'Changes committed'}\n")
-        f.write(f"- Tests run: {state.state['current_session']['tests_run']}\n")
-
-        if state.state['current_session']['files_modified']:
-            f.write(f"\n## Files Modified\n")
-            for file in state.state['current_session']['files_modified'][:10]:  # First 10
-                f.write(f"- {file}\n")
-
-        f.write(f"\n## Patterns Status\n")
-        patterns_dir = Path('patterns')
-        if patterns_dir.exists():
-            for pattern in sorted(patterns_dir.glob('*/*.py')):
-                f.write(f"- {pattern.relative_to(patterns_dir)}\n")
+    session_file = date_dir / f"session_{now:%H%M}.md"
+    # Build the note in memory and write it with a single call
+    parts = [
+        f"# Session Notes - {now_disp}\n\n",
+        "## Metadata\n",
+        f"- Duration: {state.get_session_duration()}\n",
+        f"- Session #: {state.state['session_count']}\n",
+        f"- Working directory: {Path.cwd()}\n",
+        f"- Git status: {'Clean' if not git_status else 'Changes committed'}\n",
+        f"- Tests run: {state.state['current_session']['tests_run']}\n",
+    ]
+
+    if state.state['current_session']['files_modified']:
+        parts.append("\n## Files Modified\n")
+        for file in state.state['current_session']['files_modified'][:10]:  # First 10
+            parts.append(f"- {file}\n")
+
+    parts.append("\n## Patterns Status\n")
+    current = state.state['current_session']
+    current['patterns_snapshot'] = scan_patterns(cached=current.get('patterns_snapshot'))
+    for pattern in current['patterns_snapshot']['scripts']:
+        parts.append(f"- {pattern}\n")
+
+    session_file.write_text(''.join(parts))
 
     print(f"📝 Session note: {date_str}/{session_file.name}")
 
     # Update state
-    state.end_session()
+    state.end_session(now)
 
     # Clean up old sessions
     organize_session_notes()
@@ -298,87 +585,92 @@ def sign_off(force_push=False, status_only=False):
         force_push: If True, attempt push even if dry-run fails
         status_only: If True, only show status without making changes
     """
-    state = SessionState()
+    now = datetime.now()
+    now_disp = now.strftime('%Y-%m-%d %H:%M')
 
     # Phase 3: Load configuration
     config_file = Path('.session_config.json')
     config = {}
     if config_file.exists():
         try:
-            with open(config_file, 'r') as f:
-                config = json.load(f)
+            config = _json_load(config_file)
         except:
             pass
 
-    print(f"{BOLD}{BLUE}## Sign Off - {datetime.now():%Y-%m-%d %H:%M}{RESET}")
-    print(f"⏱ Session duration: {state.get_session_duration()}")
+    print(f"{BOLD}{BLUE}## Sign Off - {now_disp}{RESET}")
+    # Phase 3: Status check mode only reads state, so skip loading/saving it
+    if status_only:
+        raw = peek_state()
+        start_time = (raw.get('current_session') or {}).get('start_time')
+        print(f"⏱ Session duration: {session_duration(start_time)}")
+    else:
+        state = get_state()
+        print(f"⏱ Session duration: {state.get_session_duration()}")
+
+    # One snapshot covers status, unpushed count and current branch
+    snapshot = git_snapshot()
 
-    # Phase 3: Status check mode
     if status_only:
-        git_status = run_command("git status --short")
-        unpushed = run_command("git log @{u}..HEAD --oneline 2>/dev/null")
         print(f"📊 Status:")
-        print(f"  • Uncommitted: {len(git_status.splitlines()) if git_status else 0} files")
-        print(f"  • Unpushed: {len(unpushed.splitlines()) if unpushed else 0} commits")
+        print(f"  • Uncommitted: {len(snapshot.changed_files)} files")
+        print(f"  • Unpushed: {snapshot.ahead} commits")
         if config.get('default_branch'):
             print(f"  • Default branch: {config['default_branch']}")
         return
 
     # Quick commit
-    git_status = run_command("git status --short")
-
-    if git_status:
-        run_command("git add -A")
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
-        commit_msg = f"chore: Quick sign off at {timestamp}"
-        run_command(f'git commit -m "{commit_msg}"')
+    if snapshot.changed_files:
+        git("add", "-A")
+        commit_msg = f"chore: Quick sign off at {now_disp}"
+        git("commit", "-F", "-", input=commit_msg)
         print(f"{GREEN}✓ Changes committed{RESET}")
         state.state['total_commits'] += 1
     else:
         print("✓ No changes to commit")
 
     # Check if we have a remote
-    remote = run_command("git remote -v")
+    remote = git("remote", "-v")
     if remote and 'origin' in remote:
         print("📤 Pushing to remote...")
 
         # Phase 1 Fix: Use current branch instead of guessing
-        current_branch = run_command("git branch --show-current")
+        current_branch = snapshot.branch
         if current_branch:
-            current_branch = current_branch.strip()
 
-            # Phase 2: Add dry-run check first
-            dry_run = run_command(f"git push --dry-run origin {current_branch} 2>&1")
-            if dry_run and 'rejected' in dry_run.lower() and not force_push:
-                print(f"{YELLOW}⚠ Push would be rejected. Pull first or use --force-push{RESET}")
-                print(f"  Details: {dry_run.split('error:')[1] if 'error:' in dry_run else dry_run[:100]}")
-                return
-
-            # Attempt actual push with retry logic
+            # Attempt push with retry logic; --porcelain reports one line per
+            # ref ("<flag>\t<from>:<to>\t<summary>"), '!' marking rejection,
+            # so no separate dry-run or verification round-trip is needed
             max_retries = config.get('max_retries', 3)
             for attempt in range(max_retries):
-                result = run_command(f"git push origin {current_branch} 2>&1")
+                result = git("push", "--porcelain", "origin", current_branch, merge_stderr=True)
+                ref_lines = [
+                    line for line in result.splitlines()
+                    if line[:1] in PUSH_FLAGS and '\t' in line
+                ]
+                rejected = any(line.startswith('!') for line in ref_lines)
+
+                # Phase 2: Stop before retrying a rejected push
+                if rejected and not force_push:
+                    print(f"{YELLOW}⚠ Push would be rejected. Pull first or use --force-push{RESET}")
+                    print(f"  Details: {result.split('error:')[1] if 'error:' in result else result[:100]}")
+                    return
 
                 # Check for success
-                if result and 'error' not in result.lower() and 'rejected' not in result.lower():
-                    # Verify push succeeded
-                    verify = run_command(f"git log origin/{current_branch}..{current_branch} --oneline")
-                    if not verify:  # No commits ahead means push succeeded
-                        print(f"{GREEN}✓ Pushed to origin/{current_branch}{RESET}")
-
-                        # Phase 3: Save successful branch to config
-                        if not config.get('default_branch'):
-                            config['default_branch'] = current_branch
-                            try:
-                                with open(config_file, 'w') as f:
-                                    json.dump(config, f, indent=2)
-                            except:
-                                pass
-
-                        # Auto-setup origin/HEAD if missing
-                        if not run_command("git symbolic-ref refs/remotes/origin/HEAD 2>/dev/null"):
-                            run_command(f"git symbolic-ref refs/remotes/origin/HEAD refs/remotes/origin/{current_branch}")
-                        break
+                if ref_lines and not rejected:
+                    print(f"{GREEN}✓ Pushed to origin/{current_branch}{RESET}")
+
+                    # Phase 3: Save successful branch to config
+                    if not config.get('default_branch'):
+                        config['default_branch'] = current_branch
+                        try:
+                            _json_dump(config, config_file, indent=True)
+                        except:
+                            pass
+
+                    # Auto-setup origin/HEAD if missing
+                    if not git("symbolic-ref", "refs/remotes/origin/HEAD"):
+                        git("symbolic-ref", "refs/remotes/origin/HEAD", f"refs/remotes/origin/{current_branch}")
+                    break
 
                 # Handle specific errors
                 if result and 'connection' in result.lower() and attempt < max_retries - 1:
@@ -393,28 +685,30 @@ def sign_off(force_push=False, status_only=False):
         print("ℹ No remote configured")
 
     # Quick session note
-    state.end_session()
+    state.end_session(now)
 
     print(f"{GREEN}✅ Signed off.{RESET}")
 
 
 def status():
     """Show current session status"""
-    state = SessionState()
+    raw = peek_state()
+    current = raw.get('current_session') or {}
 
     print(f"{BOLD}{BLUE}## Session Status{RESET}")
-    print(f"📊 Total sessions: {state.state['session_count']}")
-    print(f"💾 Total commits: {state.state['total_commits']}")
-
-    if state.state['last_wake']:
-        print(f"🌅 Last wake: {state.state['last_wake']}")
-    if state.state['last_wind_down']:
-        print(f"🌙 Last wind down: {state.state['last_wind_down']}")
-
-    if state.state['current_session']['start_time']:
-        print(f"⏱ Current session: {state.get_session_duration()}")
-        print(f"📝 Files modified: {len(state.state['current_session']['files_modified'])}")
-        print(f"🧪 Tests run: {state.state['current_session']['tests_run']}")
+    print(f"📊 Total sessions: {raw.get('session_count', 0)}")
+    print(f"💾 Total commits: {raw.get('total_commits', 0)}")
+
+    if raw.get('last_wake'):
+        print(f"🌅 Last wake: {raw['last_wake']}")
+    if raw.get('last_wind_down'):
+        print(f"🌙 Last wind down: {raw['last_wind_down']}")
+
+    if current.get('start_time'):
+        print(f"⏱ Current session: {session_duration(current['start_time'])}")
+        files_modified = current.get('files_modified', [])
+        print(f"📝 Files modified: {current.get('files_modified_count', len(files_modified))}")
+        print(f"🧪 Tests run: {current.get('tests_run', 0)}")
 
 
 def main():
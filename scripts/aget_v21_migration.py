@@ -27,6 +27,14 @@ class V21Migration:
         """Check what migrations are needed."""
         needed = []
 
+        # One directory listing answers every existence check below
+        try:
+            with os.scandir(self.scripts_dir) as it:
+                listing = [entry.name for entry in it]
+        except OSError:
+            listing = None
+        names = set(listing or ())
+
         # Check for framework scripts without aget_ prefix
         framework_scripts = [
             "housekeeping_protocol.py",
@@ -36,26 +44,25 @@ class V21Migration:
         ]
 
         for script in framework_scripts:
-            old_path = self.scripts_dir / script
-            if old_path.exists():
+            if script in names:
                 new_name = f"aget_{script.replace('-', '_')}"
                 needed.append(f"Rename: {script} → {new_name}")
 
         # Check for custom scripts with aget_ prefix (warn only)
-        if self.scripts_dir.exists():
-            # List of known framework scripts that should have aget_ prefix
-            framework_scripts_with_prefix = [
+        if listing is not None:
+            # Known framework scripts that should have aget_ prefix
+            framework_scripts_with_prefix = {
                 "aget_housekeeping_protocol.py",
                 "aget_session_protocol.py",
                 "aget_check_permissions.py",
                 "aget_pre_release.sh",
                 "aget_v21_migration.py",
-            ]
+            }
 
-            for script in self.scripts_dir.glob("aget_*"):
+            for name in listing:
                 # Skip if it's a known framework script
-                if script.name not in framework_scripts_with_prefix:
-                    needed.append(f"WARNING: Unknown script has aget_ prefix: {script.name}")
+                if name.startswith("aget_") and name not in framework_scripts_with_prefix:
+                    needed.append(f"WARNING: Unknown script has aget_ prefix: {name}")
 
         return needed
 
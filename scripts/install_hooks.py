@@ -12,10 +12,14 @@ Usage:
 
 import sys
 import os
+import shutil
 from pathlib import Path
 import subprocess
 import argparse
 
+# Interpreter the shell hooks invoke; pytest must be installed for this one
+HOOK_PYTHON = 'python3'
+
 HOOK_PHASES = {
     'advisory': '''#!/bin/bash
 # AGET Pre-Push Hook - Advisory Mode (Phase 1)
@@ -51,10 +55,8 @@ exit 0
 
 echo "🔍 Running critical tests (5-10 seconds)..."
 
-# Check for pytest
-if ! command -v pytest &> /dev/null; then
-    pip3 install -q pytest pytest-cov
-fi
+# pytest is checked (and installed if needed) when the hook is installed
+python3 -m pytest --version > /dev/null 2>&1 || { echo "❌ pytest missing; reinstall hook: python3 scripts/install_hooks.py --critical"; exit 1; }
 
 # Define critical tests that MUST pass
 CRITICAL_TESTS="
@@ -85,84 +87,193 @@ echo "✅ Critical tests passed"
 exit 0
 ''',
 
-    'smart': '''#!/bin/bash
-# AGET Pre-Push Hook - Smart Mode (Phase 3)
-# Runs tests based on what changed
-
-echo "🔍 Smart pre-push checks..."
-
-# Get current branch
-BRANCH=$(git rev-parse --abbrev-ref HEAD)
-
-# Get list of modified files compared to main
-CHANGED_FILES=$(git diff --name-only origin/main...HEAD 2>/dev/null)
-
-# If can't compare to main, just run critical tests
-if [ -z "$CHANGED_FILES" ]; then
-    echo "   Running critical tests (can't detect changes)..."
-    TESTS="tests/test_installer.py::test_installer_minimal_template"
-else
-    # Build test list based on changes
-    TESTS=""
-
-    # Core framework changes
-    if echo "$CHANGED_FILES" | grep -q "^aget/"; then
-        TESTS="$TESTS tests/test_gate2_features.py"
-    fi
-
-    # Pattern changes
-    if echo "$CHANGED_FILES" | grep -q "^patterns/"; then
-        TESTS="$TESTS tests/test_*pattern*.py"
-    fi
-
-    # Installer changes
-    if echo "$CHANGED_FILES" | grep -q "install\\.sh\\|installer\\.py"; then
-        TESTS="$TESTS tests/test_installer.py tests/test_enhanced_installer.py"
-    fi
-
-    # Session protocol changes
-    if echo "$CHANGED_FILES" | grep -q "session.*protocol"; then
-        TESTS="$TESTS tests/test_session_protocol.py"
-    fi
-fi
+    'smart': r'''#!/usr/bin/env python3
+"""AGET Pre-Push Hook - Smart Mode (Phase 3)
+Runs tests based on what changed
+"""
+import glob
+import os
+import re
+import subprocess
+import sys
 
-# Run relevant tests if any
-if [ -n "$TESTS" ]; then
-    echo "📊 Testing affected areas..."
-    echo "   Files changed: $(echo "$CHANGED_FILES" | wc -l)"
-    echo "   Tests to run: $(echo $TESTS | wc -w)"
-
-    timeout 15 python3 -m pytest $TESTS -q --tb=no --maxfail=3
-
-    RESULT=$?
-    if [ $RESULT -eq 124 ]; then
-        echo "⚠️  Tests timed out (>15s). Consider running manually."
-        echo "   git push --no-verify (to skip)"
-        exit 0
-    elif [ $RESULT -ne 0 ]; then
-        echo "❌ Tests failed for changed files"
-        echo ""
-        echo "   Changed files in:"
-        echo "$CHANGED_FILES" | cut -d'/' -f1 | sort -u | sed 's/^/     - /'
-        echo ""
-        echo "   Run tests: python3 -m pytest $TESTS -v"
-        echo "   Skip hook: git push --no-verify"
-        exit 1
-    fi
-else
-    echo "   No test-worthy changes detected"
-fi
+# One pass over the changed-file list; each named group selects tests. The
+# groups sit in lookaheads so one group's match never hides another's
+CHANGE_RE = re.compile(
+    r'(?=(?P<core>^aget/))'
+    r'|(?=(?P<pattern>^patterns/))'
+    r'|(?=(?P<installer>install\.sh|installer\.py))'
+    r'|(?=(?P<session>session.*protocol))',
+    re.MULTILINE
+)
+GROUP_TESTS = {
+    'core': ['tests/test_gate2_features.py'],
+    'pattern': sorted(glob.glob('tests/test_*pattern*.py')),
+    'installer': ['tests/test_installer.py', 'tests/test_enhanced_installer.py'],
+    'session': ['tests/test_session_protocol.py'],
+}
+FALLBACK_TESTS = ['tests/test_installer.py::test_installer_minimal_template']
+
+
+def git(*args):
+    """Run git without taking optional locks; '' on failure."""
+    result = subprocess.run(['git', '--no-optional-locks'] + list(args),
+                            capture_output=True, text=True)
+    return result.stdout.strip() if result.returncode == 0 else ''
+
+
+def merge_base():
+    """Merge-base of HEAD and origin/main, cached per (HEAD, origin/main)."""
+    key = git('rev-parse', 'HEAD', 'origin/main').replace('\n', ' ')
+    if not key:
+        return ''
+    cache = os.path.join(git('rev-parse', '--git-dir'), 'aget-mergebase')
+    try:
+        with open(cache) as f:
+            cached_key, cached_mb = f.read().splitlines()[:2]
+        if cached_key == key:
+            return cached_mb
+    except (OSError, ValueError):
+        pass
+    mb = git('merge-base', 'origin/main', 'HEAD')
+    if mb:
+        try:
+            with open(cache, 'w') as f:
+                f.write(f'{key}\n{mb}\n')
+        except OSError:
+            pass
+    return mb
+
+
+def select_tests(changed):
+    """Tests to run for a 'git diff --name-only' listing, in GROUP_TESTS order."""
+    groups = {m.lastgroup for m in CHANGE_RE.finditer(changed)}
+    return [t for group in GROUP_TESTS if group in groups for t in GROUP_TESTS[group]]
 
-echo "✅ All relevant tests passed"
-exit 0
+
+def main():
+    print("🔍 Smart pre-push checks...")
+
+    # Get list of modified files compared to main
+    mb = merge_base()
+    changed = git('diff', '--name-only', mb, 'HEAD') if mb else ''
+
+    # If can't compare to main, just run critical tests
+    if not changed:
+        print("   Running critical tests (can't detect changes)...")
+        tests = FALLBACK_TESTS
+    else:
+        tests = select_tests(changed)
+
+    if not tests:
+        print("   No test-worthy changes detected")
+        print("✅ All relevant tests passed")
+        return 0
+
+    # Run relevant tests
+    print("📊 Testing affected areas...")
+    print(f"   Files changed: {len(changed.splitlines())}")
+    print(f"   Tests to run: {len(tests)}")
+
+    try:
+        result = subprocess.run(
+            [sys.executable, '-m', 'pytest'] + tests + ['-q', '--tb=no', '--maxfail=3'],
+            timeout=15
+        )
+    except subprocess.TimeoutExpired:
+        print("⚠️  Tests timed out (>15s). Consider running manually.")
+        print("   git push --no-verify (to skip)")
+        return 0
+
+    if result.returncode != 0:
+        print("❌ Tests failed for changed files")
+        print("")
+        print("   Changed files in:")
+        for top in sorted({line.split('/')[0] for line in changed.splitlines()}):
+            print(f"     - {top}")
+        print("")
+        print(f"   Run tests: python3 -m pytest {' '.join(tests)} -v")
+        print("   Skip hook: git push --no-verify")
+        return 1
+
+    print("✅ All relevant tests passed")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
 ''',
 
     'remove': None  # Special case for removal
 }
 
+# Hook bodies encoded once, ready to write as-is
+_HOOK_PHASES_BYTES = {k: (v.encode('utf-8') if v else None) for k, v in HOOK_PHASES.items()}
+
+
+def _write_hook(path, data):
+    """Install data at path as an executable file, all or nothing.
+
+    The hook is written in full to a temp file beside it, then renamed over
+    path, so a short or failed write never leaves a truncated hook behind.
+    """
+    tmp = path.with_name(path.name + '.tmp')
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+    try:
+        # O_CREAT's mode only applies to new files; fchmod covers leftovers
+        os.fchmod(fd, 0o755)
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    except BaseException:
+        os.close(fd)
+        os.unlink(tmp)
+        raise
+    os.close(fd)
+    os.replace(tmp, path)
+
+
+def _hook_up_to_date(path, content):
+    """True if path already holds exactly content with 0o755 permissions."""
+    try:
+        with open(path, 'rb') as f:
+            mode = os.fstat(f.fileno()).st_mode
+            return (mode & 0o777) == 0o755 and f.read() == content
+    except OSError:
+        return False
+
+
+def _ensure_pytest():
+    """Make sure the hook's python3 can import pytest, installing it if missing.
+
+    Checks the interpreter the hook runs (python3 on PATH), which need not
+    be the one running this installer.
+    """
+    python = shutil.which(HOOK_PYTHON)
+    if python is None:
+        print(f"❌ {HOOK_PYTHON} not found on PATH; the hook needs it to run tests")
+        return False
+
+    probe = subprocess.run([python, '-m', 'pytest', '--version'], capture_output=True)
+    if probe.returncode == 0:
+        return True
+
+    print(f"📦 Installing pytest for the critical-tests hook ({python})...")
+    try:
+        subprocess.run([python, '-m', 'pip', 'install', '-q', 'pytest', 'pytest-cov'],
+                       check=True)
+    except (OSError, subprocess.CalledProcessError):
+        print("❌ Could not install pytest; install it and retry")
+        return False
+    return True
+
 
 def install_hook(phase='advisory', force=False):
-    """Install pre-push hook for given phase."""
+    """Install pre-push hook for given phase.
+
+    Idempotent: an identical existing hook is left untouched, so its mtime
+    doesn't change and file watchers see no write.
+    """
     git_dir = Path('.git')
     if not git_dir.exists():
         print("❌ Not a git repository")
@@ -172,6 +283,12 @@ def install_hook(phase='advisory', force=False):
     hooks_dir.mkdir(exist_ok=True)
 
     pre_push = hooks_dir / 'pre-push'
+    hook_content = _HOOK_PHASES_BYTES.get(phase)
+
+    if hook_content and _hook_up_to_date(pre_push, hook_content):
+        print(f"✅ {phase.capitalize()} mode pre-push hook already up-to-date")
+        print(f"   Location: {pre_push}")
+        return True
 
     # Check if hook exists
     if pre_push.exists() and not force:
@@ -181,11 +298,13 @@ def install_hook(phase='advisory', force=False):
             print("Cancelled")
             return False
 
+    # The critical hook relies on pytest; settle that now, not on every push
+    if phase == 'critical' and not _ensure_pytest():
+        return False
+
     # Write hook content
-    hook_content = HOOK_PHASES.get(phase)
     if hook_content:
-        pre_push.write_text(hook_content)
-        pre_push.chmod(0o755)
+        _write_hook(pre_push, hook_content)
         print(f"✅ Installed {phase} mode pre-push hook")
         print(f"   Location: {pre_push}")
         return True
@@ -213,7 +332,7 @@ def test_hook():
         return False
 
     print("🧪 Testing pre-push hook...")
-    result = subprocess.run([str(pre_push)], capture_output=False)
+    result = subprocess.run([os.fspath(pre_push)], capture_output=False)
     return result.returncode == 0
 
 
@@ -5,45 +5,114 @@ Follows the self-contained architecture principle: each AGET has its own copies.
 """
 
 import json
+import os
 import shutil
 import sys
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locking
+    fcntl = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+DEP_FILE = Path(".aget/dependencies.json")
+
 
 def load_dependencies():
     """Load the dependencies manifest."""
-    dep_file = Path(".aget/dependencies.json")
-    if not dep_file.exists():
+    if not DEP_FILE.exists():
         print("❌ No dependencies.json found")
         return None
 
-    with open(dep_file) as f:
-        return json.load(f)
+    data = DEP_FILE.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
-def install_pattern(pattern_name, source_path=None):
+def _atomic_write_json(path, data):
+    """Write data as indented JSON to a temp file, then rename it over path.
+
+    The temp file is fsynced before the atomic os.replace, and the directory
+    after it, so even a crash leaves either the old or the new manifest.
     """
-    Install a pattern by copying it locally.
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2).encode("utf-8")
+    tmp = path.with_suffix(".json.tmp")
+    with open(tmp, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    _fsync_dir(path.parent)
+
+
+def _fsync_dir(directory):
+    """Persist a rename in directory (a no-op where directories can't be opened)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return  # Windows
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
 
-    Args:
-        pattern_name: Name like "documentation/smart_reader.py"
-        source_path: Override source path (optional)
+
+def _flush_deps(deps):
+    """Write the dependencies manifest back to disk."""
+    _atomic_write_json(DEP_FILE, deps)
+
+
+@contextmanager
+def _manifest_lock():
+    """Hold an exclusive advisory lock for a manifest read-modify-write.
+
+    The lock lives on a sidecar file because the manifest itself is replaced
+    (new inode) on every write. A no-op without fcntl or an .aget directory.
     """
-    deps = load_dependencies()
-    if not deps:
-        return False
+    if fcntl is None or not DEP_FILE.parent.is_dir():
+        yield
+        return
+    with open(DEP_FILE.with_suffix(".json.lock"), "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
 
-    # Find pattern in manifest
-    pattern_info = None
+
+def _build_index(deps):
+    """Map pattern name to its manifest entry (required before optional)."""
+    index = {}
     for p in deps.get("required_patterns", []) + deps.get("optional_patterns", []):
-        if p["name"] == pattern_name:
-            pattern_info = p
-            break
+        index.setdefault(p["name"], p)
+    return index
 
-    if not pattern_info:
-        print(f"❌ Pattern '{pattern_name}' not found in dependencies.json")
-        return False
+
+def _install_one(pattern_info, source_path=None):
+    """
+    Copy one already-resolved pattern into place and mark it installed.
+
+    Only the in-memory manifest entry is updated; writing the manifest is
+    left to the caller.
+
+    Args:
+        pattern_info: The pattern's entry from dependencies.json
+        source_path: Override source path (optional)
+    """
+    pattern_name = pattern_info["name"]
 
     # Determine source
     source = Path(source_path or pattern_info.get("source", ""))
@@ -56,7 +125,7 @@ def install_pattern(pattern_name, source_path=None):
     dest = Path("patterns") / pattern_name
     dest.parent.mkdir(parents=True, exist_ok=True)
 
-    # Copy the pattern
+    # Copy the pattern (copy2 already copies in-kernel via sendfile on Linux)
     try:
         shutil.copy2(source, dest)
         print(f"✅ Installed: {pattern_name}")
@@ -67,10 +136,6 @@ def install_pattern(pattern_name, source_path=None):
         pattern_info["status"] = "installed"
         pattern_info["installed_date"] = datetime.now().isoformat()
         pattern_info["installed_from"] = str(source)
-
-        with open(".aget/dependencies.json", "w") as f:
-            json.dump(deps, f, indent=2)
-
         return True
 
     except Exception as e:
@@ -78,22 +143,56 @@ def install_pattern(pattern_name, source_path=None):
         return False
 
 
-def install_all_required():
-    """Install all required patterns that are missing."""
-    deps = load_dependencies()
-    if not deps:
-        return
+def install_pattern(pattern_name, source_path=None):
+    """
+    Install a pattern by copying it locally.
 
-    installed = 0
-    failed = 0
+    Args:
+        pattern_name: Name like "documentation/smart_reader.py"
+        source_path: Override source path (optional)
+    """
+    with _manifest_lock():
+        deps = load_dependencies()
+        if not deps:
+            return False
+
+        # Find pattern in manifest
+        pattern_info = _build_index(deps).get(pattern_name)
+
+        if not pattern_info:
+            print(f"❌ Pattern '{pattern_name}' not found in dependencies.json")
+            return False
+
+        if not _install_one(pattern_info, source_path):
+            return False
 
-    for pattern in deps.get("required_patterns", []):
-        if pattern.get("status") != "installed":
-            print(f"\n📦 Installing {pattern['name']}...")
-            if install_pattern(pattern["name"]):
-                installed += 1
-            else:
-                failed += 1
+        _flush_deps(deps)
+        return True
+
+
+def install_all_required():
+    """Install all required patterns that are missing."""
+    # Lock across the read, installs and write so concurrent runs serialize
+    with _manifest_lock():
+        deps = load_dependencies()
+        if not deps:
+            return
+
+        installed = 0
+        failed = 0
+
+        # The entries are already at hand, so skip install_pattern's lookup
+        for pattern in deps.get("required_patterns", []):
+            if pattern.get("status") != "installed":
+                print(f"\n📦 Installing {pattern['name']}...")
+                if _install_one(pattern):
+                    installed += 1
+                else:
+                    failed += 1
+
+        # One manifest write for the whole run
+        if installed:
+            _flush_deps(deps)
 
     print(f"\n📊 Summary: {installed} installed, {failed} failed")
 
@@ -4,11 +4,18 @@ Install verification script
 Tests that the installer works correctly in a temporary directory
 """
 
+import io
+import mmap
 import os
+import re
 import sys
 import tempfile
 import shutil
+import stat
 import subprocess
+import importlib.util
+import traceback
+from contextlib import redirect_stdout, redirect_stderr
 from pathlib import Path
 
 # Colors for output
@@ -19,13 +26,122 @@ BLUE = '\033[94m'
 RESET = '\033[0m'
 BOLD = '\033[1m'
 
+
+def _load_installer(installer_path):
+    """Import installer/install.py as a module, or None if it can't be loaded"""
+    try:
+        spec = importlib.util.spec_from_file_location('aget_installer', os.fspath(installer_path))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+    except Exception:
+        return None
+
+
+# Files each template must install, checked against the installed tree
+_EXPECTED_FILES = {
+    'minimal': frozenset({'AGENTS.md', 'CLAUDE.md', 'scripts/session_protocol.py', 'Makefile'}),
+    'standard': frozenset({'AGENTS.md', 'CLAUDE.md', 'scripts/session_protocol.py',
+                           'scripts/housekeeping_protocol.py', 'Makefile'}),
+    'advanced': frozenset({'AGENTS.md', 'CLAUDE.md', 'scripts/session_protocol.py',
+                           'scripts/housekeeping_protocol.py', 'Makefile'}),
+}
+
+# Tokens test_customization looks for in AGENTS.md, found in one pass
+CUSTOMIZATION_RE = re.compile(
+    rb'(?P<placeholder_name>\{\{PROJECT_NAME\}\})'
+    rb'|(?P<project_name>my_awesome_project)'
+    rb'|(?P<placeholder_type>\{\{PROJECT_TYPE\}\})'
+    rb'|(?P<python>Python)'
+)
+
+
+def _scan_tokens(path):
+    """Names of the CUSTOMIZATION_RE groups found in path, or None if unreadable
+
+    Scans an mmap of the file and stops as soon as every token has been seen.
+    """
+    seen = set()
+    try:
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return seen
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                for m in CUSTOMIZATION_RE.finditer(buf):
+                    seen.add(m.lastgroup)
+                    if len(seen) == 4:
+                        break
+    except OSError:
+        return None
+    return seen
+
+
+def _make_test_dir(root, name):
+    """Create and return a fresh <root>/<unique>/<name> project directory
+
+    The project keeps its plain name (the installer derives the project name
+    from it) under a unique parent, so tests can share one temporary root.
+    """
+    test_dir = Path(tempfile.mkdtemp(dir=root)) / name
+    test_dir.mkdir()
+    return test_dir
+
+
+def _relative_paths(root):
+    """Set of '/'-separated paths of every entry under root, relative to it"""
+    present = set()
+    for dirpath, dirnames, filenames in os.walk(root):
+        rel = os.path.relpath(dirpath, root)
+        prefix = '' if rel == '.' else rel.replace(os.sep, '/') + '/'
+        present.update(prefix + name for name in dirnames)
+        present.update(prefix + name for name in filenames)
+    return present
+
+
 class InstallVerifier:
     """Verify CLI Agent Template installation"""
 
     def __init__(self):
         self.repo_root = Path(__file__).parent.parent
         self.installer_path = self.repo_root / 'installer/install.py'
+        # String forms built once for the subprocess argv
+        self._installer_path_str = os.fspath(self.installer_path)
+        self._python_exe = sys.executable
         self.test_results = []
+        # Run the installer in-process; subprocess only if it can't be imported
+        self.installer = _load_installer(self.installer_path)
+
+    def _invoke(self, argv):
+        """Run the installer with argv, returning (returncode, stderr)
+
+        In-process calls swap sys.argv instead of paying an interpreter start
+        per test; SystemExit carries the exit code. Only stderr is kept (for
+        failure reports): stdout is discarded rather than buffered.
+        """
+        if self.installer is None:
+            result = subprocess.run(
+                [self._python_exe, self._installer_path_str] + argv,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True
+            )
+            return result.returncode, result.stderr
+
+        err = io.StringIO()
+        saved_argv = sys.argv
+        sys.argv = ['install.py'] + argv
+        try:
+            with open(os.devnull, 'w') as devnull, redirect_stdout(devnull), redirect_stderr(err):
+                self.installer.main()
+            code = 0
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except Exception:
+            err.write(traceback.format_exc())
+            code = 1
+        finally:
+            sys.argv = saved_argv
+        return code, err.getvalue()
 
     def run(self):
         """Run all verification tests"""
@@ -36,150 +152,130 @@ class InstallVerifier:
         # Test all template types
         templates = ['minimal', 'standard', 'advanced']
 
-        for template in templates:
-            if not self.test_template_install(template):
-                return 1
+        # All tests work in subdirectories of one shared temporary root
+        with tempfile.TemporaryDirectory(prefix='aget-verify-') as root:
+            for template in templates:
+                if not self.test_template_install(template, root):
+                    return 1
 
-        # Test dry-run mode
-        if not self.test_dry_run():
-            return 1
+            # Test dry-run mode
+            if not self.test_dry_run(root):
+                return 1
 
-        # Test file customization
-        if not self.test_customization():
-            return 1
+            # Test file customization
+            if not self.test_customization(root):
+                return 1
 
         # Print summary
         self.print_summary()
         return 0 if all(self.test_results) else 1
 
-    def test_template_install(self, template):
+    def test_template_install(self, template, root):
         """Test installation of a specific template"""
         print(f"\n{BOLD}Testing {template} template...{RESET}")
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_dir = Path(tmpdir) / 'test_project'
-            test_dir.mkdir()
-
-            # Create a minimal project structure
-            (test_dir / 'README.md').write_text('# Test Project')
+        test_dir = _make_test_dir(root, 'test_project')
+
+        # Create a minimal project structure
+        (test_dir / 'README.md').write_text('# Test Project')
+
+        # Run installer
+        returncode, stderr = self._invoke([str(test_dir), '--template', template])
+
+        if returncode != 0:
+            print(f"  {RED}✗ Installation failed{RESET}")
+            print(f"  Error: {stderr}")
+            self.test_results.append(False)
+            return False
+
+        # Verify expected files exist, from one walk of the install
+        missing = sorted(_EXPECTED_FILES.get(template, frozenset()) - _relative_paths(test_dir))
+
+        if missing:
+            print(f"  {RED}✗ Missing files: {', '.join(missing)}{RESET}")
+            self.test_results.append(False)
+            return False
+
+        # Verify CLAUDE.md is a symlink (or copy)
+        claude_path = test_dir / 'CLAUDE.md'
+        try:
+            claude_mode = os.lstat(claude_path).st_mode
+        except OSError:
+            claude_mode = None
+        if claude_mode is not None and stat.S_ISLNK(claude_mode):
+            print(f"  {GREEN}✓ CLAUDE.md symlink created{RESET}")
+        elif claude_mode is not None:
+            print(f"  {YELLOW}✓ CLAUDE.md copy created (symlinks not supported){RESET}")
+        else:
+            print(f"  {RED}✗ CLAUDE.md not created{RESET}")
+            self.test_results.append(False)
+            return False
 
-            # Run installer
-            result = subprocess.run(
-                [sys.executable, str(self.installer_path), str(test_dir), '--template', template],
-                capture_output=True,
-                text=True
-            )
+        print(f"  {GREEN}✓ {template.capitalize()} template installed successfully{RESET}")
+        self.test_results.append(True)
+        return True
 
-            if result.returncode != 0:
-                print(f"  {RED}✗ Installation failed{RESET}")
-                print(f"  Error: {result.stderr}")
-                self.test_results.append(False)
-                return False
-
-            # Verify expected files exist
-            expected_files = {
-                'minimal': ['AGENTS.md', 'CLAUDE.md', 'scripts/session_protocol.py', 'Makefile'],
-                'standard': ['AGENTS.md', 'CLAUDE.md', 'scripts/session_protocol.py',
-                            'scripts/housekeeping_protocol.py', 'Makefile'],
-                'advanced': ['AGENTS.md', 'CLAUDE.md', 'scripts/session_protocol.py',
-                            'scripts/housekeeping_protocol.py', 'Makefile']
-            }
-
-            missing = []
-            for expected in expected_files.get(template, []):
-                if not (test_dir / expected).exists():
-                    missing.append(expected)
-
-            if missing:
-                print(f"  {RED}✗ Missing files: {', '.join(missing)}{RESET}")
-                self.test_results.append(False)
-                return False
-
-            # Verify CLAUDE.md is a symlink (or copy)
-            claude_path = test_dir / 'CLAUDE.md'
-            if claude_path.is_symlink():
-                print(f"  {GREEN}✓ CLAUDE.md symlink created{RESET}")
-            elif claude_path.exists():
-                print(f"  {YELLOW}✓ CLAUDE.md copy created (symlinks not supported){RESET}")
-            else:
-                print(f"  {RED}✗ CLAUDE.md not created{RESET}")
-                self.test_results.append(False)
-                return False
-
-            print(f"  {GREEN}✓ {template.capitalize()} template installed successfully{RESET}")
-            self.test_results.append(True)
-            return True
-
-    def test_dry_run(self):
+    def test_dry_run(self, root):
         """Test dry-run mode"""
         print(f"\n{BOLD}Testing dry-run mode...{RESET}")
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_dir = Path(tmpdir) / 'test_project'
-            test_dir.mkdir()
+        test_dir = _make_test_dir(root, 'test_project')
 
-            # Run installer in dry-run mode
-            result = subprocess.run(
-                [sys.executable, str(self.installer_path), str(test_dir), '--dry-run'],
-                capture_output=True,
-                text=True
-            )
+        # Run installer in dry-run mode
+        returncode, _ = self._invoke([str(test_dir), '--dry-run'])
 
-            if result.returncode != 0:
-                print(f"  {RED}✗ Dry-run failed{RESET}")
-                self.test_results.append(False)
-                return False
+        if returncode != 0:
+            print(f"  {RED}✗ Dry-run failed{RESET}")
+            self.test_results.append(False)
+            return False
 
-            # Verify no files were created
-            files_created = list(test_dir.glob('*'))
-            if files_created:
-                print(f"  {RED}✗ Dry-run created files: {files_created}{RESET}")
-                self.test_results.append(False)
-                return False
+        # Verify no files were created
+        files_created = list(test_dir.glob('*'))
+        if files_created:
+            print(f"  {RED}✗ Dry-run created files: {files_created}{RESET}")
+            self.test_results.append(False)
+            return False
 
-            print(f"  {GREEN}✓ Dry-run mode works correctly{RESET}")
-            self.test_results.append(True)
-            return True
+        print(f"  {GREEN}✓ Dry-run mode works correctly{RESET}")
+        self.test_results.append(True)
+        return True
 
-    def test_customization(self):
+    def test_customization(self, root):
         """Test file customization (template variable replacement)"""
         print(f"\n{BOLD}Testing file customization...{RESET}")
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_dir = Path(tmpdir) / 'my_awesome_project'
-            test_dir.mkdir()
+        test_dir = _make_test_dir(root, 'my_awesome_project')
 
-            # Create Python project indicators
-            (test_dir / 'requirements.txt').write_text('pytest\n')
+        # Create Python project indicators
+        (test_dir / 'requirements.txt').write_text('pytest\n')
 
-            # Run installer
-            subprocess.run(
-                [sys.executable, str(self.installer_path), str(test_dir), '--template', 'minimal'],
-                capture_output=True,
-                text=True
-            )
+        # Run installer
+        self._invoke([str(test_dir), '--template', 'minimal'])
 
-            # Check AGENTS.md was customized
-            agents_content = (test_dir / 'AGENTS.md').read_text()
+        # Check AGENTS.md was customized
+        seen = _scan_tokens(test_dir / 'AGENTS.md')
 
-            errors = []
-            if '{{PROJECT_NAME}}' in agents_content:
+        errors = []
+        if seen is None:
+            errors.append('AGENTS.md not created')
+        else:
+            if 'placeholder_name' in seen:
                 errors.append('PROJECT_NAME not replaced')
-            if 'my_awesome_project' not in agents_content:
+            if 'project_name' not in seen:
                 errors.append('Project name not inserted')
-            if '{{PROJECT_TYPE}}' in agents_content:
+            if 'placeholder_type' in seen:
                 errors.append('PROJECT_TYPE not replaced')
-            if 'Python' not in agents_content:
+            if 'python' not in seen:
                 errors.append('Python project type not detected')
 
-            if errors:
-                print(f"  {RED}✗ Customization failed: {', '.join(errors)}{RESET}")
-                self.test_results.append(False)
-                return False
+        if errors:
+            print(f"  {RED}✗ Customization failed: {', '.join(errors)}{RESET}")
+            self.test_results.append(False)
+            return False
 
-            print(f"  {GREEN}✓ File customization works correctly{RESET}")
-            self.test_results.append(True)
-            return True
+        print(f"  {GREEN}✓ File customization works correctly{RESET}")
+        self.test_results.append(True)
+        return True
 
     def print_summary(self):
         """Print test summary"""
@@ -7,14 +7,78 @@ Usage: python3 aget_v20_to_v21_migration.py [--dry-run] [--verbose]
 """
 
 import os
+import re
 import json
+import errno
 import shutil
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Tuple
 
+# errno values meaning copy_file_range can't be used for this pair of files
+_NO_COPY_RANGE = {errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP}
+
+
+def _copy_file(src: str, dst: str):
+    """Copy one file's contents and metadata, in-kernel where possible
+
+    copy_file_range lets Btrfs/XFS reflink instead of copying bytes; where it
+    is unavailable, shutil.copyfile still uses sendfile (Linux) or the
+    platform's native copy.
+    """
+    copied = False
+    if hasattr(os, 'copy_file_range'):
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            try:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if n == 0:
+                        break
+                    remaining -= n
+                else:
+                    copied = True
+            except OSError as e:
+                if e.errno not in _NO_COPY_RANGE:
+                    raise
+    if not copied:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+def _fast_copytree(src: Path, dst: Path):
+    """Copy a directory tree like shutil.copytree, copying files in parallel
+
+    Directories are created up front from one scandir walk; the IO-bound file
+    copies then run on a small thread pool.
+    """
+    dirs = [(os.fspath(src), os.fspath(dst))]
+    files = []
+    i = 0
+    while i < len(dirs):
+        src_dir, dst_dir = dirs[i]
+        i += 1
+        os.mkdir(dst_dir)
+        with os.scandir(src_dir) as it:
+            for entry in it:
+                target = os.path.join(dst_dir, entry.name)
+                if entry.is_dir():
+                    dirs.append((entry.path, target))
+                else:
+                    files.append((entry.path, target))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        # list() surfaces the first copy error, as copytree would
+        list(executor.map(lambda pair: _copy_file(*pair), files))
+
+    # Directory times last, after the copies above stop touching them
+    for src_dir, dst_dir in reversed(dirs):
+        shutil.copystat(src_dir, dst_dir)
+
+
 class V21Migrator:
     """Handles migration from AGET v2.0 to v2.1"""
 
@@ -99,7 +163,7 @@ class V21Migrator:
             shutil.rmtree(backup_path)
 
         try:
-            shutil.copytree(base_path / '.aget', backup_path)
+            _fast_copytree(base_path / '.aget', backup_path)
             self.log(f"Backup created at {backup_path}", "SUCCESS")
             return True
         except Exception as e:
@@ -108,19 +172,25 @@ class V21Migrator:
 
     def rename_patterns(self, base_path: Path) -> List[Tuple[str, str]]:
         """Rename patterns to include aget_ prefix"""
-        patterns_dir = base_path / '.aget' / 'patterns'
+        patterns_dir = os.fspath(base_path / '.aget' / 'patterns')
         renamed = []
 
-        for old_path, new_path in self.PATTERNS_TO_RENAME.items():
-            old_file = patterns_dir / old_path
-            new_file = patterns_dir / new_path
+        # One walk lists every pattern file ('/'-separated, relative), instead
+        # of a stat per mapping
+        existing = set()
+        for dirpath, _, filenames in os.walk(patterns_dir):
+            rel = os.path.relpath(dirpath, patterns_dir)
+            prefix = '' if rel == '.' else rel.replace(os.sep, '/') + '/'
+            existing.update(prefix + name for name in filenames)
 
-            if old_file.exists():
+        for old_path, new_path in self.PATTERNS_TO_RENAME.items():
+            if old_path in existing:
                 if self.dry_run:
                     self.log(f"Would rename: {old_path} → {new_path}", "INFO")
                 else:
                     try:
-                        old_file.rename(new_file)
+                        os.rename(os.path.join(patterns_dir, old_path),
+                                  os.path.join(patterns_dir, new_path))
                         self.log(f"Renamed: {old_path} → {new_path}", "SUCCESS")
                         renamed.append((old_path, new_path))
                     except Exception as e:
@@ -172,12 +242,15 @@ class V21Migrator:
             with open(claude_file) as f:
                 content = f.read()
 
-            # Replace old pattern names with new ones
+            # Replace old pattern names (filename only) with new ones in one pass
             original_content = content
-            for old_name, new_name in renamed_patterns:
-                old_ref = old_name.split('/')[-1]  # Get filename only
-                new_ref = new_name.split('/')[-1]
-                content = content.replace(old_ref, new_ref)
+            table = {old_name.split('/')[-1]: new_name.split('/')[-1]
+                     for old_name, new_name in renamed_patterns}
+            if table:
+                # Longest first, so no name is cut short by one it contains
+                names = sorted(table, key=len, reverse=True)
+                pattern = re.compile('|'.join(map(re.escape, names)))
+                content = pattern.sub(lambda m: table[m.group(0)], content)
 
             # Add v2.1 migration note if content changed
             if content != original_content:
@@ -208,6 +281,11 @@ class V21Migrator:
 
         record_file = evolution_dir / f"v21_migration_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
 
+        # Each list block is joined once, up front
+        renames_block = '\n'.join(f"- {old} → {new}" for old, new in self.PATTERNS_TO_RENAME.items())
+        report_block = '\n'.join(f"- {item}" for item in self.report)
+        errors_block = '\n'.join(f"- {error}" for error in self.errors) if self.errors else "None"
+
         content = f"""# v2.0 to v2.1 Migration Record
 
 ## Date: {datetime.now().strftime('%Y-%m-%d %H:%M')}
@@ -216,7 +294,7 @@ class V21Migrator:
 ## Changes Applied:
 
 ### Pattern Renames (aget_ prefix):
-{chr(10).join(f"- {old} → {new}" for old, new in self.PATTERNS_TO_RENAME.items())}
+{renames_block}
 
 ### Version Update:
 - From: 2.0.0
@@ -227,18 +305,17 @@ class V21Migrator:
 - Warnings: 0
 
 ## Report:
-{chr(10).join(f"- {item}" for item in self.report)}
+{report_block}
 
 ## Errors:
-{chr(10).join(f"- {error}" for error in self.errors) if self.errors else "None"}
+{errors_block}
 
 ---
 *Automated migration using aget_v20_to_v21_migration.py*
 """
 
         try:
-            with open(record_file, 'w') as f:
-                f.write(content)
+            record_file.write_text(content)
             self.log(f"Migration record created: {record_file.name}", "SUCCESS")
             return True
         except Exception as e:
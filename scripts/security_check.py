@@ -3,8 +3,16 @@
 Security check before making repository public
 """
 
+import fnmatch
+import mmap
+import os
 import re
-from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import pathspec
+except ImportError:  # Optional: .gitignore is only honored when installed
+    pathspec = None
 
 # Patterns that might indicate secrets
 SECRET_PATTERNS = [
@@ -18,51 +26,163 @@ SECRET_PATTERNS = [
     (r'/home/[a-zA-Z]+/', 'Home Path'),
 ]
 
+
+def _slug(desc):
+    """Regex group name for a pattern description ('Secret/Token' -> 'Secret_Token')"""
+    return re.sub(r'\W', '_', desc)
+
+
+def _scoped(pattern):
+    """Turn a leading global (?i) into a scoped (?i:...) so patterns can be joined"""
+    return f'(?i:{pattern[4:]})' if pattern.startswith('(?i)') else pattern
+
+
+SLUG_TO_DESC = {_slug(desc): desc for _, desc in SECRET_PATTERNS}
+DESC_ORDER = {desc: i for i, (_, desc) in enumerate(SECRET_PATTERNS)}
+
+# All patterns in one alternation. Each group sits in a lookahead so every
+# position is tried, and one pattern's match never hides another's.
+COMBINED = re.compile('|'.join(
+    f'(?=(?P<{_slug(desc)}>{_scoped(pattern)}))' for pattern, desc in SECRET_PATTERNS
+))
+
+# The same alternation over bytes, so files can be screened without decoding
+COMBINED_BYTES = re.compile(COMBINED.pattern.encode())
+
+# Every pattern needs one of these literals (lowercased), so a file without
+# any of them can skip the regex entirely
+PREFILTER_TOKENS = (b'api', b'secret', b'token', b'password', b'sk-', b'ghp_', b'bearer', b'@',
+                    b'/users/', b'/home/')
+
+# Lines that look like examples/documentation rather than real secrets
+SKIP_RE = re.compile(r'(?i)example|you:|agent:')
+
+# Below this size reading the file is cheaper than setting up an mmap
+MMAP_MIN_SIZE = 4096
+
+# Secrets are short text tokens; bigger files are dumps or binaries
+MAX_SCAN_BYTES = 2 * 1024 * 1024
+
+# A NUL byte this close to the start marks a binary file (git's heuristic)
+BINARY_SNIFF_BYTES = 8192
+
+# Below one chunk of files a process pool costs more than it saves
+CHUNK_SIZE = 64
+
+def _has_candidate(f, size):
+    """True if the open binary file f might contain a secret
+
+    Small files are read and screened for the required literals; larger ones
+    are mapped so the regex scans the page cache without a copy. Binary files
+    never are.
+    """
+    if size < MMAP_MIN_SIZE:
+        data = f.read()
+        if b'\0' in data:
+            return False
+        lowered = data.lower()
+        if not any(token in lowered for token in PREFILTER_TOKENS):
+            return False
+        return COMBINED_BYTES.search(data) is not None
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if mm.find(b'\0', 0, BINARY_SNIFF_BYTES) != -1:
+            return False
+        return COMBINED_BYTES.search(mm) is not None
+
+
 def scan_file(filepath):
     """Scan a single file for potential secrets"""
     issues = []
     try:
-        content = filepath.read_text()
+        with open(filepath, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            # Any match on a line is also a match in the whole file, so one
+            # sweep clears the common no-secrets file before any decoding
+            if size == 0 or size > MAX_SCAN_BYTES or not _has_candidate(f, size):
+                return issues
+            f.seek(0)
+            content = f.read().decode()
         for line_num, line in enumerate(content.splitlines(), 1):
-            # Skip example/documentation lines
-            if any(indicator in line.lower() for indicator in ['example', 'you:', 'agent:']):
+            # One sweep per line; report each kind once, in SECRET_PATTERNS order
+            found = {SLUG_TO_DESC[m.lastgroup] for m in COMBINED.finditer(line)}
+            if not found:
+                continue
+
+            # Skip example/documentation lines (only checked on a hit)
+            if SKIP_RE.search(line):
                 continue
 
-            for pattern, desc in SECRET_PATTERNS:
-                if re.search(pattern, line):
-                    # Skip generic user paths in examples
-                    if desc == 'User Path' and '/Users/you/' in line:
-                        continue
-                    issues.append(f"{filepath}:{line_num} - Potential {desc}")
+            for desc in sorted(found, key=DESC_ORDER.__getitem__):
+                # Skip generic user paths in examples
+                if desc == 'User Path' and '/Users/you/' in line:
+                    continue
+                issues.append(f"{filepath}:{line_num} - Potential {desc}")
     except Exception:
         pass  # Skip binary files
     return issues
 
+
+def _load_gitignore():
+    """PathSpec for ./.gitignore, or None without pathspec or a .gitignore"""
+    if pathspec is None:
+        return None
+    try:
+        with open('.gitignore') as f:
+            return pathspec.PathSpec.from_lines('gitwildmatch', f)
+    except OSError:
+        return None
+
+
 def main():
     """Run security scan"""
     print("🔍 Security Check - Scanning for sensitive data...\n")
 
     # Skip these directories
-    skip_dirs = {'.git', '__pycache__', '.pytest_cache', 'SESSION_NOTES'}
+    skip_dirs = {'.git', '__pycache__', '.pytest_cache', 'SESSION_NOTES',
+                 '.aget.backup-v20', 'node_modules', 'venv', '.venv', 'dist', 'build'}
+    ignored = _load_gitignore()
 
-    # Skip files matching .gitignore patterns
+    # Skip files matching .gitignore patterns (one regex over basenames)
     skip_patterns = ['.aider*', '*.log', '*.pyc', '.DS_Store']
+    skip_re = re.compile('|'.join(fnmatch.translate(pattern) for pattern in skip_patterns))
 
-    all_issues = []
-    for filepath in Path('.').rglob('*'):
-        if filepath.is_file():
-            # Skip if in ignored directory
-            if any(skip in filepath.parts for skip in skip_dirs):
+    paths = []
+    for dirpath, dirnames, filenames in os.walk('.'):
+        # Prune ignored directories so they are never listed
+        prefix = '' if dirpath == '.' else dirpath[2:] + os.sep
+        dirnames[:] = [d for d in dirnames if d not in skip_dirs]
+        if ignored is not None:
+            # Gitignored trees are pruned whole; patterns use '/' separators
+            rel = prefix.replace(os.sep, '/')
+            dirnames[:] = [d for d in dirnames if not ignored.match_file(rel + d + '/')]
+        for name in filenames:
+            if name in skip_dirs:
                 continue
             # Skip this script and test files
-            if filepath.name == 'security_check.py' or 'test' in filepath.name:
+            if name == 'security_check.py' or 'test' in name:
                 continue
             # Skip files matching gitignore patterns
-            if any(filepath.match(pattern) for pattern in skip_patterns):
+            if skip_re.match(name):
                 continue
+            if ignored is not None and ignored.match_file((prefix + name).replace(os.sep, '/')):
+                continue
+
+            paths.append(prefix + name)
 
-            issues = scan_file(filepath)
-            all_issues.extend(issues)
+    # Files are independent, so fan larger trees out across processes
+    if len(paths) < CHUNK_SIZE:
+        results = map(scan_file, paths)
+    else:
+        try:
+            with ProcessPoolExecutor() as executor:
+                results = list(executor.map(scan_file, paths, chunksize=CHUNK_SIZE))
+        except (OSError, RuntimeError):
+            # No usable process pool here; scan serially
+            results = map(scan_file, paths)
+
+    all_issues = []
+    for issues in results:
+        all_issues.extend(issues)
 
     if all_issues:
         print("⚠️  FOUND POTENTIAL ISSUES:\n")
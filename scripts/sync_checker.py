@@ -6,7 +6,7 @@ Validates that fundamental standards are actually shared with AGET.
 
 import os
 import sys
-import hashlib
+import mmap
 from pathlib import Path
 from typing import Dict, List, Tuple
 
@@ -25,6 +25,21 @@ FUNDAMENTAL_CONTENT = {
     "PATTERN_STRUCTURE": "def apply_pattern(",
 }
 
+# Mission string as UTF-8, so files can be searched without decoding them
+MISSION_BYTES = FUNDAMENTAL_CONTENT["MISSION"].encode("utf-8")
+
+def _same_contents(a: Path, b: Path) -> bool:
+    """True if two files of equal, non-zero size hold the same bytes.
+
+    Both are mapped and compared directly (a memcmp that stops at the first
+    difference), so nothing is copied or hashed.
+    """
+    with open(a, 'rb') as fa, open(b, 'rb') as fb, \
+            mmap.mmap(fa.fileno(), 0, access=mmap.ACCESS_READ) as ma, \
+            mmap.mmap(fb.fileno(), 0, access=mmap.ACCESS_READ) as mb:
+        with memoryview(ma) as va, memoryview(mb) as vb:
+            return va == vb
+
 def check_fundamental_files() -> List[str]:
     """Check if fundamental files exist and match AGET."""
     issues = []
@@ -41,13 +56,14 @@ def check_fundamental_files() -> List[str]:
             continue
 
         if aget_file.exists():
-            # Compare hashes
-            with open(aget_file, 'rb') as f:
-                aget_hash = hashlib.md5(f.read()).hexdigest()
-            with open(local_file, 'rb') as f:
-                local_hash = hashlib.md5(f.read()).hexdigest()
+            # Different sizes means diverged; only equal sizes need comparing
+            size = aget_file.stat().st_size
+            if size != local_file.stat().st_size:
+                issues.append(f"Diverged fundamental: {file_path}")
+                continue
 
-            if aget_hash != local_hash:
+            # Empty files can't be mapped, and are trivially equal
+            if size and not _same_contents(aget_file, local_file):
                 issues.append(f"Diverged fundamental: {file_path}")
 
     return issues
@@ -63,8 +79,7 @@ def check_mission_alignment() -> List[str]:
     mission_found = False
     for mission_file in mission_files:
         if mission_file.exists():
-            content = mission_file.read_text()
-            if FUNDAMENTAL_CONTENT["MISSION"] in content:
+            if MISSION_BYTES in mission_file.read_bytes():
                 mission_found = True
                 break
 
@@ -4,18 +4,68 @@ Track Claude Code costs incrementally for long-running projects.
 This script demonstrates parsing /cost output for incremental tracking.
 """
 
+import os
 import re
 import json
+import atexit
+import hashlib
 import subprocess
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# total_cost as json.dumps writes it, so summing needs no JSON parse
+_COST_FIELD_RE = re.compile(rb'"total_cost":\s*(-?[0-9][0-9.eE+-]*)\s*[,}]')
+
+
+# Log bytes just before the index offset that are fingerprinted, so a log
+# rewritten in place (checkout, pull, merge) is noticed even if it grew
+_TAIL_BYTES = 256
+
+
+def _empty_index() -> Dict:
+    """Index covering no log bytes."""
+    return {'offset': 0, 'total': 0.0, 'count': 0, 'ino': None, 'tail': ''}
+
+
+def _tail_digest(f, offset: int) -> str:
+    """Digest of the up to _TAIL_BYTES bytes of open binary file f before offset."""
+    start = max(0, offset - _TAIL_BYTES)
+    f.seek(start)
+    return hashlib.blake2b(f.read(offset - start), digest_size=16).hexdigest()
+
+
+def _loads(data):
+    """Parse JSON bytes, with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 class ClaudeCostTracker:
+    # The "Total ..." summary lines, found in one pass over the output
+    _TOTALS_RE = re.compile(
+        r'Total cost:\s+\$(?P<total_cost>[0-9.]+)'
+        r'|Total duration \(API\):\s+(?P<api_duration_seconds>[0-9.]+)s'
+        r'|Total duration \(wall\):\s+(?P<wall_duration_seconds>[0-9.]+)s'
+    )
+    _CHANGES_RE = re.compile(r'(\d+) lines added, (\d+) lines removed')
+    _MODEL_RE = re.compile(
+        r'([a-z0-9-]+):\s+([0-9.]+)k? input, ([0-9.]+)k? output.*\(\$([0-9.]+)\)'
+    )
+
     def __init__(self, project_dir: Path = None):
         self.project_dir = project_dir or Path.cwd()
         self.cost_log_file = self.project_dir / '.aget' / 'claude_costs.jsonl'
         self.cost_log_file.parent.mkdir(parents=True, exist_ok=True)
+        # Running totals up to a byte offset, so the log is only parsed once
+        self._index_file = self.cost_log_file.with_suffix('.index.json')
+        # Append handle, opened on the first save and held until close()
+        self._log_fp = None
 
     def parse_cost_output(self, output: str) -> Optional[Dict]:
         """Parse the /cost command output into structured data."""
@@ -24,30 +74,21 @@ class ClaudeCostTracker:
             'project': str(self.project_dir)
         }
 
-        # Parse total cost: $X.XXXX
-        cost_match = re.search(r'Total cost:\s+\$([0-9.]+)', output)
-        if cost_match:
-            data['total_cost'] = float(cost_match.group(1))
-
-        # Parse durations
-        api_duration_match = re.search(r'Total duration \(API\):\s+([0-9.]+)s', output)
-        if api_duration_match:
-            data['api_duration_seconds'] = float(api_duration_match.group(1))
-
-        wall_duration_match = re.search(r'Total duration \(wall\):\s+([0-9.]+)s', output)
-        if wall_duration_match:
-            data['wall_duration_seconds'] = float(wall_duration_match.group(1))
+        # Parse total cost: $X.XXXX and durations (first of each wins)
+        for match in self._TOTALS_RE.finditer(output):
+            key = match.lastgroup
+            if key not in data:
+                data[key] = float(match.group(key))
 
         # Parse code changes
-        changes_match = re.search(r'(\d+) lines added, (\d+) lines removed', output)
+        changes_match = self._CHANGES_RE.search(output)
         if changes_match:
             data['lines_added'] = int(changes_match.group(1))
             data['lines_removed'] = int(changes_match.group(2))
 
         # Parse model usage
         models = {}
-        model_pattern = r'([a-z0-9-]+):\s+([0-9.]+)k? input, ([0-9.]+)k? output.*\(\$([0-9.]+)\)'
-        for match in re.finditer(model_pattern, output):
+        for match in self._MODEL_RE.finditer(output):
             model_name = match.group(1).strip()
             models[model_name] = {
                 'input_tokens': float(match.group(2)) * 1000,  # Convert k to actual
@@ -81,30 +122,127 @@ Usage by model:
 
         return self.parse_cost_output(sample_output)
 
+    def _load_index(self) -> Dict:
+        """Read the sidecar index, or an empty one if missing or unreadable."""
+        try:
+            index = json.loads(self._index_file.read_text())
+            return {'offset': int(index['offset']),
+                    'total': float(index['total']),
+                    'count': int(index['count']),
+                    'ino': index['ino'],
+                    'tail': str(index['tail'])}
+        except (OSError, ValueError, KeyError, TypeError):
+            return _empty_index()
+
+    @staticmethod
+    def _index_matches(index: Dict, f, st) -> bool:
+        """True if index still describes the start of the open log f (stat st).
+
+        The log must be the same file (inode), at least as long as the
+        indexed part, and end that part with the same bytes.
+        """
+        if index['offset'] == 0:
+            return True
+        return (index['ino'] == st.st_ino and st.st_size >= index['offset']
+                and index['tail'] == _tail_digest(f, index['offset']))
+
+    def _save_index(self, index: Dict):
+        """Write the sidecar index."""
+        self._index_file.write_text(json.dumps(index))
+
+    def _updated_index(self) -> Dict:
+        """Bring the index up to date by parsing only log bytes past its offset."""
+        index = self._load_index()
+        try:
+            f = open(self.cost_log_file, 'rb')
+        except OSError:
+            return _empty_index()
+
+        with f:
+            st = os.fstat(f.fileno())
+            if not self._index_matches(index, f, st):
+                # Log was truncated, replaced or rewritten; start over
+                index = _empty_index()
+            index['ino'] = st.st_ino
+            if st.st_size == index['offset']:
+                return index
+
+            f.seek(index['offset'])
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break  # Partial entry still being written
+                index['offset'] += len(line)
+                match = _COST_FIELD_RE.search(line)
+                if match:
+                    try:
+                        index['total'] += float(match.group(1))
+                        index['count'] += 1
+                        continue
+                    except ValueError:
+                        pass
+                # No plain total_cost field: parse the line to count it
+                try:
+                    entry = _loads(line)
+                except ValueError:
+                    continue
+                index['total'] += entry.get('total_cost', 0.0)
+                index['count'] += 1
+
+            index['tail'] = _tail_digest(f, index['offset'])
+
+        self._save_index(index)
+        return index
+
     def save_cost_entry(self, cost_data: Dict):
         """Append cost entry to the log file."""
-        with open(self.cost_log_file, 'a') as f:
-            f.write(json.dumps(cost_data) + '\n')
+        line = (json.dumps(cost_data) + '\n').encode()
+        if self._log_fp is None:
+            # Unbuffered append: each entry is one write(), visible at once
+            self._log_fp = open(self.cost_log_file, 'ab', buffering=0)
+            atexit.register(self.close)
+        # Only the append; the index folds new lines in on the next read
+        self._log_fp.write(line)
+
+    def close(self):
+        """Close the held log handle, if any."""
+        if self._log_fp is not None:
+            self._log_fp.close()
+            self._log_fp = None
+            atexit.unregister(self.close)
+
+    def _recent_entries(self, n: int) -> List[Dict]:
+        """Last n parseable log entries, read backwards from the end of the log."""
+        with open(self.cost_log_file, 'rb') as f:
+            pos = f.seek(0, 2)
+            tail = b''
+            while pos > 0:
+                step = min(pos, 64 * 1024)
+                pos -= step
+                f.seek(pos)
+                tail = f.read(step) + tail
+                # The first line may be cut off unless we reached the start
+                lines = tail.splitlines() if pos == 0 else tail.splitlines()[1:]
+                entries = []
+                for line in lines:
+                    try:
+                        entries.append(_loads(line))
+                    except ValueError:
+                        continue
+                if len(entries) >= n:
+                    return entries[-n:]
+        return entries[-n:] if tail else []
 
     def get_cumulative_cost(self) -> float:
         """Calculate cumulative cost from all log entries."""
         if not self.cost_log_file.exists():
             return 0.0
 
-        total = 0.0
-        with open(self.cost_log_file) as f:
-            for line in f:
-                try:
-                    entry = json.loads(line)
-                    total += entry.get('total_cost', 0.0)
-                except json.JSONDecodeError:
-                    continue
-
-        return total
+        return self._updated_index()['total']
 
     def report(self) -> str:
         """Generate a cost report for the project."""
-        cumulative = self.get_cumulative_cost()
+        index = self._updated_index() if self.cost_log_file.exists() else None
+        cumulative = index['total'] if index else 0.0
 
         report = f"""
 ## Claude Code Cost Report
@@ -114,21 +252,13 @@ Log File: {self.cost_log_file}
 """
 
         # Show recent entries
-        if self.cost_log_file.exists():
-            entries = []
-            with open(self.cost_log_file) as f:
-                for line in f:
-                    try:
-                        entries.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        continue
-
-            if entries:
-                report += f"\nRecent Sessions ({min(3, len(entries))} of {len(entries)}):\n"
-                for entry in entries[-3:]:
-                    timestamp = entry.get('timestamp', 'Unknown')
-                    cost = entry.get('total_cost', 0.0)
-                    report += f"  - {timestamp}: ${cost:.4f}\n"
+        if index and index['count']:
+            entries = self._recent_entries(3)
+            report += f"\nRecent Sessions ({len(entries)} of {index['count']}):\n"
+            for entry in entries:
+                timestamp = entry.get('timestamp', 'Unknown')
+                cost = entry.get('total_cost', 0.0)
+                report += f"  - {timestamp}: ${cost:.4f}\n"
 
         return report
 
@@ -8,10 +8,44 @@ Part of Sprint 001 / Gate 1.
 import json
 import os
 import sys
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Complexities that count as ready for v2
+READY_SET = frozenset({"new_install", "minimal"})
+
+
+def _list_dir(path) -> Dict[str, os.DirEntry]:
+    """Map entry name to DirEntry for one directory ({} if it can't be listed)."""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name: entry for entry in it}
+    except OSError:
+        return {}
+
+
+def _exists(entry) -> bool:
+    """Path.exists() for a listed entry: symlinks must resolve, others are there."""
+    if entry is None:
+        return False
+    return os.path.exists(entry.path) if entry.is_symlink() else True
+
+
+def _is_dir(entry) -> bool:
+    """Path.is_dir() for a listed entry (follows symlinks, like pathlib)."""
+    try:
+        return entry is not None and entry.is_dir()
+    except OSError:
+        return False
+
+
 class ProjectScanner:
     """Scans projects for AGET adoption and migration readiness."""
 
@@ -41,25 +75,24 @@ class ProjectScanner:
             "has_git": False,
             "patterns_found": [],
             "migration_complexity": "unknown",
+            "is_critical": False,
             "v1_adoption_level": 0,
             "cross_project_risks": [],
             "notes": []
         }
 
-        # Check for key files
+        # Check for key files, from one listing of the project directory
+        top = _list_dir(path)
         agents_md = path / "AGENTS.md"
         claude_md = path / "CLAUDE.md"
-        scripts_dir = path / "scripts"
-        aget_dir = path / ".aget"
-        git_dir = path / ".git"
 
-        if agents_md.exists():
+        if _exists(top.get("AGENTS.md")):
             scan["has_agents_md"] = True
             scan["v1_adoption_level"] += 30
             scan["patterns_found"].append("agents-config")
 
             # Check for dangerous cross-project symlinks
-            if agents_md.is_symlink():
+            if top["AGENTS.md"].is_symlink():
                 target = agents_md.resolve()
                 if not str(target).startswith(str(path)):
                     scan["cross_project_risks"].append(
@@ -67,14 +100,20 @@ class ProjectScanner:
                     )
                     scan["migration_complexity"] = "critical"
 
-        if claude_md.exists():
+        if _exists(top.get("CLAUDE.md")):
             scan["has_claude_md"] = True
             scan["v1_adoption_level"] += 20
             scan["patterns_found"].append("claude-config")
             # Check if it's a symlink to AGENTS.md
-            if claude_md.is_symlink():
-                target = claude_md.resolve()
-                if target.name == "AGENTS.md" and target.parent == path:
+            if top["CLAUDE.md"].is_symlink():
+                # The usual link text settles it without resolving; other
+                # spellings (absolute, ../proj/AGENTS.md) are resolved and
+                # compared with the sibling AGENTS.md
+                link = os.readlink(top["CLAUDE.md"].path)
+                target = None
+                if link not in ("AGENTS.md", "./AGENTS.md"):
+                    target = claude_md.resolve()
+                if target is None or target == path.resolve() / "AGENTS.md":
                     scan["notes"].append("CLAUDE.md → AGENTS.md symlink (✅ correct)")
                 else:
                     scan["cross_project_risks"].append(
@@ -82,29 +121,28 @@ class ProjectScanner:
                     )
                     scan["migration_complexity"] = "critical"
 
-        if scripts_dir.exists() and scripts_dir.is_dir():
+        if _is_dir(top.get("scripts")):
             scan["has_scripts_dir"] = True
             scan["v1_adoption_level"] += 10
 
-            # Check for specific protocols
-            session_script = scripts_dir / "session_protocol.py"
-            if session_script.exists():
+            # Check for specific protocols, from a second listing
+            scripts = _list_dir(top["scripts"].path)
+            if _exists(scripts.get("session_protocol.py")):
                 scan["has_session_protocol"] = True
                 scan["v1_adoption_level"] += 20
                 scan["patterns_found"].append("session-management")
 
-            housekeeping = scripts_dir / "housekeeping_protocol.py"
-            if housekeeping.exists():
+            if _exists(scripts.get("housekeeping_protocol.py")):
                 scan["has_housekeeping"] = True
                 scan["v1_adoption_level"] += 10
                 scan["patterns_found"].append("housekeeping")
 
-        if aget_dir.exists() and aget_dir.is_dir():
+        if _is_dir(top.get(".aget")):
             scan["has_aget_dir"] = True
             scan["v1_adoption_level"] += 10
             scan["patterns_found"].append("aget-state")
 
-        if git_dir.exists():
+        if _exists(top.get(".git")):
             scan["has_git"] = True
 
         # Determine migration complexity
@@ -125,6 +163,7 @@ class ProjectScanner:
         # Special checks for critical projects
         if project_name == "GM-RKB":
             scan["notes"].append("⚠️ CRITICAL: Production RKB agent - test thoroughly")
+            scan["is_critical"] = True
             scan["migration_complexity"] = "critical"
         elif project_name == "CCB":
             scan["notes"].append("Active development project - good test case")
@@ -138,41 +177,41 @@ class ProjectScanner:
         """Scan all specified projects."""
         for project in projects:
             print(f"Scanning {project}...")
-            self.results["projects"][Path(project).name] = self.scan_project(project)
+            scan = self.scan_project(project)
+            # scan_project already derived the name; error results lack it
+            name = scan["name"] if "name" in scan else Path(project).name
+            self.results["projects"][name] = scan
 
     def generate_summary(self) -> Dict[str, Any]:
         """Generate summary statistics."""
         projects = self.results["projects"]
+
+        # One pass over the projects gathers every statistic
+        v1_adopted = ready_for_v2 = critical_projects = 0
+        patterns_coverage = Counter()
+        effort = Counter()
+        for project in projects.values():
+            complexity = project.get("migration_complexity", "unknown")
+            v1_adopted += project.get("v1_adoption_level", 0) > 0
+            ready_for_v2 += complexity in READY_SET
+            critical_projects += bool(project.get("is_critical"))
+            effort[complexity] += 1
+            patterns_coverage.update(project.get("patterns_found", ()))
+
         summary = {
             "total_projects": len(projects),
-            "v1_adopted": sum(1 for p in projects.values() if p.get("v1_adoption_level", 0) > 0),
-            "ready_for_v2": sum(1 for p in projects.values() if p.get("migration_complexity") in ["new_install", "minimal"]),
-            "critical_projects": sum(1 for p in projects.values() if "CRITICAL" in str(p.get("notes", []))),
-            "patterns_coverage": {},
+            "v1_adopted": v1_adopted,
+            "ready_for_v2": ready_for_v2,
+            "critical_projects": critical_projects,
+            "patterns_coverage": dict(patterns_coverage),
+            # Only the known complexities are reported, each even when zero
             "migration_effort": {
-                "new_install": 0,
-                "minimal": 0,
-                "moderate": 0,
-                "complete": 0,
-                "critical": 0,
-                "dogfood": 0
+                complexity: effort[complexity]
+                for complexity in ("new_install", "minimal", "moderate",
+                                   "complete", "critical", "dogfood")
             }
         }
 
-        # Count pattern coverage
-        all_patterns = set()
-        for project in projects.values():
-            patterns = project.get("patterns_found", [])
-            for pattern in patterns:
-                all_patterns.add(pattern)
-                summary["patterns_coverage"][pattern] = summary["patterns_coverage"].get(pattern, 0) + 1
-
-        # Count migration effort
-        for project in projects.values():
-            complexity = project.get("migration_complexity", "unknown")
-            if complexity in summary["migration_effort"]:
-                summary["migration_effort"][complexity] += 1
-
         self.results["summary"] = summary
         return summary
 
@@ -181,55 +220,65 @@ class ProjectScanner:
         output = Path(output_path)
         output.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output, 'w') as f:
-            json.dump(self.results, f, indent=2)
+        # Encode once and write the bytes in one go
+        if orjson is not None:
+            payload = orjson.dumps(self.results,
+                                   option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            payload = json.dumps(self.results, indent=2).encode("utf-8")
+        output.write_bytes(payload)
 
         print(f"\nResults saved to: {output}")
 
     def print_report(self) -> None:
         """Print human-readable report."""
-        print("\n" + "="*60)
-        print("AGET v2 PROJECT SCANNER BASELINE REPORT")
-        print("="*60)
+        # Lines are collected and written once, not printed one by one
+        lines = []
+        add = lines.append
+        add("\n" + "="*60)
+        add("AGET v2 PROJECT SCANNER BASELINE REPORT")
+        add("="*60)
 
         for name, project in self.results["projects"].items():
-            print(f"\n📁 {name}")
-            print(f"   Path: {project.get('path', 'unknown')}")
-            print(f"   v1 Adoption: {project.get('v1_adoption_level', 0)}%")
-            print(f"   Migration: {project.get('migration_complexity', 'unknown')}")
+            add(f"\n📁 {name}")
+            add(f"   Path: {project.get('path', 'unknown')}")
+            add(f"   v1 Adoption: {project.get('v1_adoption_level', 0)}%")
+            add(f"   Migration: {project.get('migration_complexity', 'unknown')}")
 
             patterns = project.get('patterns_found', [])
             if patterns:
-                print(f"   Patterns: {', '.join(patterns)}")
+                add(f"   Patterns: {', '.join(patterns)}")
 
             notes = project.get('notes', [])
             for note in notes:
-                print(f"   📝 {note}")
+                add(f"   📝 {note}")
 
             risks = project.get('cross_project_risks', [])
             for risk in risks:
-                print(f"   🚨 RISK: {risk}")
+                add(f"   🚨 RISK: {risk}")
 
         if "summary" in self.results:
             summary = self.results["summary"]
-            print("\n" + "-"*60)
-            print("SUMMARY")
-            print("-"*60)
-            print(f"Total Projects: {summary['total_projects']}")
-            print(f"Using v1: {summary['v1_adopted']}")
-            print(f"Ready for v2: {summary['ready_for_v2']}")
-            print(f"Critical: {summary['critical_projects']}")
-
-            print("\nMigration Effort Distribution:")
+            add("\n" + "-"*60)
+            add("SUMMARY")
+            add("-"*60)
+            add(f"Total Projects: {summary['total_projects']}")
+            add(f"Using v1: {summary['v1_adopted']}")
+            add(f"Ready for v2: {summary['ready_for_v2']}")
+            add(f"Critical: {summary['critical_projects']}")
+
+            add("\nMigration Effort Distribution:")
             for complexity, count in summary['migration_effort'].items():
                 if count > 0:
-                    print(f"  {complexity}: {count} project(s)")
+                    add(f"  {complexity}: {count} project(s)")
 
-            print("\nPattern Coverage:")
+            add("\nPattern Coverage:")
             for pattern, count in summary['patterns_coverage'].items():
-                print(f"  {pattern}: {count} project(s)")
+                add(f"  {pattern}: {count} project(s)")
+
+        add("\n" + "="*60)
 
-        print("\n" + "="*60)
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -11,71 +11,108 @@ This could graduate to AGET if successful, or remain a private QA tool.
 import os
 import ast
 import sys
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
-def validate_pattern(pattern_file: Path) -> Tuple[bool, List[str]]:
-    """Validate a single pattern file meets AGET standards."""
-    issues = []
+# Below one chunk of files a process pool costs more than it saves
+CHUNK_SIZE = 16
 
+# Everything the rules need from one file, gathered in a single parse and walk
+ParsedModule = namedtuple('ParsedModule', 'tree source docstring funcs has_try')
+
+def parse_module(source: str) -> ParsedModule:
+    """Parse source once and collect what the validation rules look at."""
+    tree = ast.parse(source)
+    funcs = set()
+    has_try = False
+    for node in ast.walk(tree):
+        if isinstance(node, ast.FunctionDef):
+            funcs.add(node.name)
+        elif isinstance(node, ast.Try):
+            has_try = True
+    # Raw docstring, so its length is judged as written
+    docstring = ast.get_docstring(tree, clean=False)
+    return ParsedModule(tree, source, docstring, frozenset(funcs), has_try)
+
+def check_apply_pattern(pm: ParsedModule) -> Optional[str]:
+    """Patterns must define apply_pattern()."""
+    if 'apply_pattern' not in pm.funcs:
+        return "Missing required apply_pattern() function"
+    return None
+
+def check_docstring(pm: ParsedModule) -> Optional[str]:
+    """Patterns need a module docstring explaining their purpose."""
+    if pm.docstring is None:
+        return "Missing module docstring"
+    if len(pm.docstring) < 20:
+        return "Docstring too short (should explain pattern purpose)"
+    return None
+
+def check_error_handling(pm: ParsedModule) -> Optional[str]:
+    """Patterns should handle failures gracefully."""
+    if not pm.has_try:
+        return "No error handling (patterns should handle failures gracefully)"
+    return None
+
+# Rules run in this order against one ParsedModule; each returns an issue or None
+RULES = (check_apply_pattern, check_docstring, check_error_handling)
+
+def validate_pattern(pattern_file) -> Tuple[bool, List[str]]:
+    """Validate a single pattern file (str or Path) meets AGET standards.
+
+    Side-effect free, so it can run in a worker process.
+    """
     # Check file exists
-    if not pattern_file.exists():
+    if not os.path.exists(pattern_file):
         return False, [f"File not found: {pattern_file}"]
 
     # Read and parse the Python file
     try:
         with open(pattern_file, 'r') as f:
-            content = f.read()
-            tree = ast.parse(content)
+            pm = parse_module(f.read())
     except SyntaxError as e:
         return False, [f"Syntax error: {e}"]
 
-    # Check for required apply_pattern function
-    has_apply_pattern = False
-    for node in ast.walk(tree):
-        if isinstance(node, ast.FunctionDef) and node.name == 'apply_pattern':
-            has_apply_pattern = True
-            # Check it returns a dict
-            # This is a simple check - could be more sophisticated
-            break
-
-    if not has_apply_pattern:
-        issues.append("Missing required apply_pattern() function")
-
-    # Check for docstring
-    if tree.body and isinstance(tree.body[0], ast.Expr) and isinstance(tree.body[0].value, ast.Str):
-        docstring = tree.body[0].value.s
-        if len(docstring) < 20:
-            issues.append("Docstring too short (should explain pattern purpose)")
-    else:
-        issues.append("Missing module docstring")
-
-    # Check for proper error handling
-    has_try_except = False
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Try):
-            has_try_except = True
-            break
-
-    if not has_try_except:
-        issues.append("No error handling (patterns should handle failures gracefully)")
-
+    issues = [issue for issue in (rule(pm) for rule in RULES) if issue]
     return len(issues) == 0, issues
 
+def iter_pattern_files(root: str):
+    """Yield paths (str) of pattern .py files under root, skipping __init__.py.
+
+    __pycache__ directories are pruned rather than walked and filtered.
+    Like rglob, a root that is not a directory, or an unreadable directory,
+    yields nothing.
+    """
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != "__pycache__":
+                        stack.append(entry.path)
+                elif entry.name.endswith(".py") and entry.name != "__init__.py":
+                    yield entry.path
+
 def scan_patterns(pattern_dir: Path) -> Dict[str, Tuple[bool, List[str]]]:
     """Scan all patterns in a directory."""
-    results = {}
+    root = os.fspath(pattern_dir)
+    files = list(iter_pattern_files(root))
 
-    for pattern_file in pattern_dir.rglob("*.py"):
-        if "__pycache__" in str(pattern_file):
-            continue
-        if pattern_file.name == "__init__.py":
-            continue
-
-        relative_path = pattern_file.relative_to(pattern_dir)
-        results[str(relative_path)] = validate_pattern(pattern_file)
+    # Files are independent, so parse larger sets across processes
+    if len(files) < CHUNK_SIZE:
+        outcomes = map(validate_pattern, files)
+    else:
+        with ProcessPoolExecutor() as executor:
+            outcomes = list(executor.map(validate_pattern, files, chunksize=CHUNK_SIZE))
 
-    return results
+    return {os.path.relpath(pattern_file, root): outcome
+            for pattern_file, outcome in zip(files, outcomes)}
 
 def main():
     """Run pattern validation experiment."""
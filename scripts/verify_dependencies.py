@@ -4,11 +4,72 @@ Verify AGET is self-contained per ARCH-001.
 Part of the self-contained architecture implementation.
 """
 
+import contextlib
+import importlib.util
+import io
 import json
+import mmap
+import os
+import re
 import sys
-import subprocess
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Hardcoded user-directory prefixes; one alternation finds any of them in a
+# single pass over a file's raw bytes
+EXTERNAL_PATHS = ["/Users/", "C:\\Users\\", "C:/Users/"]
+EXTERNAL_PATH_RE = re.compile(b"|".join(re.escape(p.encode()) for p in EXTERNAL_PATHS))
+
+# Below this size reading the file is cheaper than setting up an mmap
+MMAP_MIN_SIZE = 4096
+
+
+# Environments, caches and build output never hold project sources
+PRUNE_DIRS = {".git", ".venv", "venv", "node_modules", "__pycache__", "build", "dist",
+              ".tox", ".mypy_cache", ".pytest_cache"}
+
+
+# Test directories (test/, tests/) and test modules (test_*.py, *_test.py)
+TEST_DIRS = {"test", "tests"}
+TEST_FILE_RE = re.compile(r"^tests?_|_test\.py$")
+
+
+def iter_source_files(exclude_files):
+    """Yield relative paths of non-test .py files under the current directory.
+
+    Pruned and test directories are never descended into.
+    """
+    for dirpath, dirnames, filenames in os.walk("."):
+        dirnames[:] = [d for d in dirnames if d not in PRUNE_DIRS and d not in TEST_DIRS]
+        prefix = "" if dirpath == "." else dirpath[2:] + os.sep
+        for name in filenames:
+            if (name.endswith(".py") and name not in exclude_files
+                    and not TEST_FILE_RE.search(name)):
+                yield prefix + name
+
+
+def find_external_path(path):
+    """First external path prefix (str) in the file at path, or None.
+
+    Larger files are mapped so the search runs over the page cache without
+    copying them into Python.
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return None
+        if size < MMAP_MIN_SIZE:
+            match = EXTERNAL_PATH_RE.search(f.read())
+            return match.group().decode() if match else None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Take the text out before the map is closed under the match
+            match = EXTERNAL_PATH_RE.search(mm)
+            return match.group().decode() if match else None
+
 
 def check_dependencies_manifest():
     """Check if dependencies.json exists and is valid."""
@@ -18,8 +79,9 @@ def check_dependencies_manifest():
         return False
 
     try:
-        with open(dep_file) as f:
-            deps = json.load(f)
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        data = dep_file.read_bytes()
+        deps = orjson.loads(data) if orjson is not None else json.loads(data)
         print("✅ dependencies.json found and valid")
         return True
     except json.JSONDecodeError as e:
@@ -27,34 +89,45 @@ def check_dependencies_manifest():
         return False
 
 
+# Offending files reported before the scan stops; one is enough to fail
+MAX_REPORTED = 10
+
+
+def iter_external_paths(exclude_files):
+    """Yield (path, prefix, error) for each file with an external path.
+
+    Unreadable files are yielded with prefix None and the error. The walk is
+    lazy, so a caller that stops early skips the rest of the tree.
+    """
+    for p in iter_source_files(exclude_files):
+        try:
+            found = find_external_path(p)
+        except Exception as e:
+            yield p, None, e
+            continue
+        if found:
+            yield p, found, None
+
+
 def check_no_external_paths():
     """Check for hardcoded external paths in Python files."""
     has_external = False
-
-    # Patterns to check for
-    patterns = ["/Users/", "C:\\Users\\", "C:/Users/"]
+    reported = 0
 
     # Files to exclude from check
     exclude_files = {"security_check.py", "verify_dependencies.py"}
 
-    for p in Path(".").rglob("*.py"):
-        # Skip excluded files
-        if p.name in exclude_files:
-            continue
-
-        # Skip test files
-        if "test" in str(p):
+    # Excluded and test files are filtered during the walk
+    for p, found, error in iter_external_paths(exclude_files):
+        if error is not None:
+            print(f"⚠️  Could not read {p}: {error}")
             continue
-
-        try:
-            content = p.read_text()
-            for pattern in patterns:
-                if pattern in content:
-                    print(f"❌ External path '{pattern}' in {p}")
-                    has_external = True
-                    break
-        except Exception as e:
-            print(f"⚠️  Could not read {p}: {e}")
+        print(f"❌ External path '{found}' in {p}")
+        has_external = True
+        reported += 1
+        if reported == MAX_REPORTED:
+            print(f"   (stopped after {MAX_REPORTED} files)")
+            break
 
     if not has_external:
         print("✅ No external paths in Python files")
@@ -83,22 +156,33 @@ def check_required_scripts():
 
 def check_pattern_installation():
     """Check if patterns can be installed."""
+    # Load and run "--help" in-process rather than starting another interpreter
+    saved_argv = sys.argv
     try:
-        result = subprocess.run(
-            ["python3", "scripts/install_pattern.py", "--help"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if result.returncode == 0:
+        spec = importlib.util.spec_from_file_location(
+            "install_pattern", "scripts/install_pattern.py")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        if not callable(getattr(module, "main", None)):
+            print("❌ install_pattern.py failed: no main() entry point")
+            return False
+
+        sys.argv = ["install_pattern.py", "--help"]
+        with contextlib.redirect_stdout(io.StringIO()):
+            module.main()
+        print("✅ install_pattern.py is functional")
+        return True
+    except SystemExit as e:
+        if e.code in (0, None):
             print("✅ install_pattern.py is functional")
             return True
-        else:
-            print(f"❌ install_pattern.py failed: {result.stderr}")
-            return False
+        print(f"❌ install_pattern.py failed: exit status {e.code}")
+        return False
     except Exception as e:
         print(f"❌ Could not run install_pattern.py: {e}")
         return False
+    finally:
+        sys.argv = saved_argv
 
 
 def check_arch_compliance():
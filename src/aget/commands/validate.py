@@ -12,56 +12,179 @@ Validates:
 
 import os
 import sys
+import re
 import json
+import hashlib
 import argparse
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
-import importlib.util
 import ast
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Per-project store of pattern validation results, keyed by pattern path
+CACHE_FILE = Path('.aget') / 'cache' / 'validate.json'
+
+# Bumped whenever the pattern checks change, so older cached results are redone
+CACHE_VERSION = 2
+
+# Top-level names that make a pattern runnable
+ENTRY_POINTS = {'main', 'run'}
+
+# Patterns that must need validating before a process pool is used. Each
+# costs ~4 ms serially, so below a few dozen the workers' start-up (far
+# more under spawn) outweighs the split; on one CPU a pool never pays
+MIN_PARALLEL_PATTERNS = 64
+PARALLEL_CHUNK_SIZE = 16
+
+# AGENTS.md sections and tag the config check looks for, found in one pass
+# over the raw bytes (the needles are ASCII, so no decoding is needed)
+REQUIRED_SECTIONS = ["## Session Management Protocols", "## Project Context"]
+VERSION_TAG = '@aget-version:'
+CONFIG_NEEDLES_RE = re.compile(
+    '|'.join(map(re.escape, REQUIRED_SECTIONS + [VERSION_TAG])).encode())
+
+# Configuration files smaller than this (in bytes) are flagged as too short
+MIN_CONFIG_SIZE = 100
+
+
+def content_hash(data: bytes) -> str:
+    """Fast hex digest of file contents (xxh64 if available, else BLAKE2b)."""
+    if xxhash is not None:
+        return xxhash.xxh64(data).hexdigest()
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
 
 
 class PatternValidator:
     """Validate pattern files for compliance."""
 
-    def __init__(self, pattern_path: Path):
+    def __init__(self, pattern_path: Path, cached: Optional[Dict] = None):
         self.path = pattern_path
         self.errors = []
         self.warnings = []
+        # Earlier result for this path ({hash, errors, warnings}), and the
+        # entry to store for this run once validate() has finished
+        self.cached = cached
+        self.cache_entry = None
 
     def validate(self) -> bool:
-        """Validate a single pattern file."""
-        if not self.path.exists():
+        """Validate a single pattern file, replaying the cached result if unchanged."""
+        try:
+            source = self.path.read_bytes()
+        except OSError:
             self.errors.append(f"Pattern file not found: {self.path}")
             return False
 
+        digest = content_hash(source)
+        if _cache_hit(self.cached, digest):
+            self.errors = list(self.cached.get('errors', []))
+            self.warnings = list(self.cached.get('warnings', []))
+        else:
+            self._check(source)
+        self.cache_entry = {'hash': digest, 'version': CACHE_VERSION,
+                            'errors': self.errors, 'warnings': self.warnings}
+        return len(self.errors) == 0
+
+    def _check(self, source: bytes) -> None:
+        """Run the validation checks on the pattern's source.
+
+        Everything is decided from the AST; the pattern is never executed.
+        """
         # Check Python syntax
         try:
-            with open(self.path, 'r') as f:
-                ast.parse(f.read())
+            tree = ast.parse(source, str(self.path))
         except SyntaxError as e:
             self.errors.append(f"Syntax error: {e}")
-            return False
-
-        # Check for required functions/classes
-        module_name = self.path.stem
-        spec = importlib.util.spec_from_file_location(module_name, self.path)
-        if not spec or not spec.loader:
-            self.errors.append(f"Cannot load pattern: {self.path}")
-            return False
+            return
 
+        # Compile-time errors the parser lets through (e.g. 'return' outside
+        # a function) would stop the pattern from loading
         try:
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-
-            # Check for main() function or run() method
-            if not hasattr(module, 'main') and not hasattr(module, 'run'):
-                self.warnings.append("Pattern has no main() or run() entry point")
-
-        except Exception as e:
-            self.errors.append(f"Import error: {e}")
-            return False
-
-        return len(self.errors) == 0
+            compile(tree, str(self.path), 'exec')
+        except (SyntaxError, ValueError) as e:
+            self.errors.append(f"Cannot load pattern: {self.path} ({e})")
+            return
+
+        # Check for main() function or run() method
+        if not has_entry_point(tree):
+            self.warnings.append("Pattern has no main() or run() entry point")
+
+
+def has_entry_point(tree: ast.Module) -> bool:
+    """True if the module defines main()/run() or a class with a run() method."""
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            if node.name in ENTRY_POINTS:
+                return True
+        elif isinstance(node, ast.ClassDef):
+            if any(isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef))
+                   and item.name == 'run' for item in node.body):
+                return True
+    return False
+
+
+def _cache_hit(cached: Optional[Dict], digest: str) -> bool:
+    """True if cached is a current-version result for contents hashing to digest."""
+    return (bool(cached) and cached.get('hash') == digest
+            and cached.get('version') == CACHE_VERSION)
+
+
+def _replay_one(path_str: str, cached: Optional[Dict]) -> Optional[Tuple[bool, List[str], List[str], Dict]]:
+    """Cached (ok, errors, warnings, cache_entry) for an unchanged file, else None."""
+    if not cached:
+        return None
+    try:
+        digest = content_hash(Path(path_str).read_bytes())
+    except OSError:
+        return None
+    if not _cache_hit(cached, digest):
+        return None
+    errors = list(cached.get('errors', []))
+    warnings = list(cached.get('warnings', []))
+    entry = {'hash': digest, 'version': CACHE_VERSION, 'errors': errors, 'warnings': warnings}
+    return not errors, errors, warnings, entry
+
+
+def _validate_one(path_str: str, cached: Optional[Dict] = None) -> Tuple[bool, List[str], List[str], Optional[Dict]]:
+    """Validate one pattern file, returning (ok, errors, warnings, cache_entry).
+
+    Module-level and returning plain values so a process pool can run it.
+    """
+    validator = PatternValidator(Path(path_str), cached=cached)
+    ok = validator.validate()
+    return ok, validator.errors, validator.warnings, validator.cache_entry
+
+
+def _iter_py(root: str):
+    """Yield paths of pattern .py files under root (not __init__ etc.).
+
+    Walks with os.scandir, using each entry's cached type instead of a stat
+    per file. Directories are visited top-down in listing order, as rglob does,
+    and like rglob a root or subdirectory that can't be listed yields nothing.
+    """
+    stack = [root]
+    while stack:
+        subdirs = []
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name.endswith('.py') and not entry.name.startswith('__'):
+                    yield entry.path
+        stack.extend(reversed(subdirs))
 
 
 class ConfigValidator:
@@ -71,32 +194,43 @@ class ConfigValidator:
         self.path = config_path
         self.errors = []
         self.warnings = []
+        # Set by validate() once the file has been scanned
+        self.has_version_tag = None
 
     def validate(self) -> bool:
         """Validate configuration file."""
-        if not self.path.exists():
+        try:
+            size = self.path.stat().st_size
+        except (FileNotFoundError, NotADirectoryError):
             self.errors.append(f"Configuration file not found: {self.path}")
             return False
+        except OSError as e:
+            self.errors.append(f"Cannot read configuration: {e}")
+            return False
 
         try:
-            content = self.path.read_text()
+            with open(self.path, 'rb') as f:
+                content = f.read()
 
-            # Check for required sections
-            required_sections = [
-                "## Session Management Protocols",
-                "## Project Context"
-            ]
+            # One sweep marks every needle present; stop once all are seen
+            seen = set()
+            for match in CONFIG_NEEDLES_RE.finditer(content):
+                seen.add(match.group().decode())
+                if len(seen) == len(REQUIRED_SECTIONS) + 1:
+                    break
 
-            for section in required_sections:
-                if section not in content:
+            # Check for required sections
+            for section in REQUIRED_SECTIONS:
+                if section not in seen:
                     self.warnings.append(f"Missing recommended section: {section}")
 
             # Check for version information
-            if '@aget-version:' not in content:
+            self.has_version_tag = VERSION_TAG in seen
+            if not self.has_version_tag:
                 self.warnings.append("No @aget-version tag found")
 
             # Check minimum length
-            if len(content) < 100:
+            if size < MIN_CONFIG_SIZE:
                 self.warnings.append("Configuration file seems too short")
 
         except Exception as e:
@@ -109,12 +243,38 @@ class ConfigValidator:
 class ProjectValidator:
     """Validate entire project structure and compliance."""
 
-    def __init__(self, project_path: Path = Path('.')):
+    def __init__(self, project_path: Path = Path('.'), use_cache: bool = True):
         self.path = project_path
         self.errors = []
         self.warnings = []
         self.checks_passed = 0
         self.checks_total = 0
+        self.use_cache = use_cache
+        # Findings that have a recommendation in generate_report
+        self._flags = set()
+
+    def _load_cache(self) -> Dict[str, Dict]:
+        """Read the pattern result cache ({} if disabled, missing or unreadable)."""
+        if not self.use_cache:
+            return {}
+        try:
+            cache = json.loads((self.path / CACHE_FILE).read_bytes())
+        except (OSError, ValueError):
+            return {}
+        return cache if isinstance(cache, dict) else {}
+
+    def _save_cache(self, cache: Dict[str, Dict]) -> None:
+        """Write the pattern result cache, only into an existing .aget/."""
+        if not self.use_cache or not (self.path / '.aget').is_dir():
+            return
+        cache_file = self.path / CACHE_FILE
+        try:
+            cache_file.parent.mkdir(exist_ok=True)
+            tmp = cache_file.with_suffix('.json.tmp')
+            tmp.write_text(json.dumps(cache))
+            os.replace(tmp, cache_file)
+        except OSError:
+            pass  # A cache that can't be written only costs speed
 
     def validate_structure(self) -> bool:
         """Validate project directory structure."""
@@ -130,6 +290,7 @@ class ProjectValidator:
                 agents_file = claude_file
             else:
                 self.errors.append("No AGENTS.md or CLAUDE.md found")
+                self._flags.add('no_agents_md')
                 return False
 
         self.checks_passed += 1
@@ -143,6 +304,8 @@ class ProjectValidator:
             self.errors.extend(config_validator.errors)
 
         self.warnings.extend(config_validator.warnings)
+        if config_validator.has_version_tag is False:
+            self._flags.add('no_version_tag')
 
         return True
 
@@ -151,24 +314,50 @@ class ProjectValidator:
         patterns_dir = self.path / 'patterns'
         if not patterns_dir.exists():
             self.warnings.append("No patterns/ directory found")
+            self._flags.add('no_patterns_dir')
             return True
 
-        pattern_files = list(patterns_dir.rglob('*.py'))
-
-        for pattern_file in pattern_files:
-            if pattern_file.name.startswith('__'):
-                continue
-
+        paths = list(_iter_py(str(patterns_dir)))
+        cache = self._load_cache()
+        fresh = {}
+
+        # Cache hits are settled here; only changed or new patterns are
+        # validated, and only this process reads or writes the cache file
+        root = str(self.path)
+        keys = [os.path.relpath(p, root).replace(os.sep, '/') for p in paths]
+        results = [_replay_one(path, cache.get(key)) for path, key in zip(paths, keys)]
+        misses = [i for i, result in enumerate(results) if result is None]
+        miss_paths = [paths[i] for i in misses]
+        workers = os.cpu_count() or 1
+        if len(miss_paths) < MIN_PARALLEL_PATTERNS or workers == 1:
+            outcomes = list(map(_validate_one, miss_paths))
+        else:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    outcomes = list(executor.map(_validate_one, miss_paths, chunksize=PARALLEL_CHUNK_SIZE))
+            except (OSError, RuntimeError):
+                # No usable process pool here; validate serially
+                outcomes = list(map(_validate_one, miss_paths))
+        for i, outcome in zip(misses, outcomes):
+            results[i] = outcome
+
+        for path, key, (ok, errors, warnings, entry) in zip(paths, keys, results):
             self.checks_total += 1
-            validator = PatternValidator(pattern_file)
-
-            if validator.validate():
+            stem = os.path.splitext(os.path.basename(path))[0]
+            if ok:
                 self.checks_passed += 1
             else:
-                self.errors.append(f"Pattern {pattern_file.stem}: {', '.join(validator.errors)}")
+                self.errors.append(f"Pattern {stem}: {', '.join(errors)}")
+
+            if warnings:
+                self.warnings.append(f"Pattern {stem}: {', '.join(warnings)}")
 
-            if validator.warnings:
-                self.warnings.append(f"Pattern {pattern_file.stem}: {', '.join(validator.warnings)}")
+            if entry is not None:
+                fresh[key] = entry
+
+        # Only patterns seen this run are kept, so deleted ones drop out
+        if fresh != cache:
+            self._save_cache(fresh)
 
         return True
 
@@ -190,6 +379,7 @@ class ProjectValidator:
             self.checks_passed += 1
         else:
             self.warnings.append("No session protocol script found")
+            self._flags.add('no_session_protocol')
 
         # Check for housekeeping protocols
         housekeeping_scripts = [
@@ -216,24 +406,33 @@ class ProjectValidator:
 
         self.checks_passed += 1
 
-        # Check for .aget directory
+        # Check for .aget directory; one listing answers both existence checks
         self.checks_total += 1
-        aget_dir = self.path / '.aget'
-        if aget_dir.exists():
+        try:
+            with os.scandir(self.path / '.aget') as it:
+                entries = {entry.name: entry for entry in it}
+        except (FileNotFoundError, NotADirectoryError):
+            self.warnings.append("No .aget directory found")
+            return True
+        except OSError as e:
+            # It exists (as before, that passes the check) but can't be listed
             self.checks_passed += 1
+            self.warnings.append(f"Cannot read .aget directory: {e}")
+            return True
 
-            # Check for version.json
-            version_file = aget_dir / 'version.json'
-            if version_file.exists():
-                try:
-                    with open(version_file) as f:
-                        data = json.load(f)
-                        if 'version' not in data:
-                            self.warnings.append("version.json missing 'version' field")
-                except Exception as e:
-                    self.warnings.append(f"Cannot parse version.json: {e}")
-        else:
-            self.warnings.append("No .aget directory found")
+        self.checks_passed += 1
+
+        # Check for version.json
+        version_entry = entries.get('version.json')
+        if version_entry is not None:
+            try:
+                with open(version_entry.path, 'rb') as f:
+                    raw = f.read()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                if 'version' not in data:
+                    self.warnings.append("version.json missing 'version' field")
+            except Exception as e:
+                self.warnings.append(f"Cannot parse version.json: {e}")
 
         return True
 
@@ -265,16 +464,16 @@ class ProjectValidator:
         if self.errors or self.warnings:
             lines.append("\n📋 Recommendations:")
 
-            if "No AGENTS.md" in str(self.errors):
+            if 'no_agents_md' in self._flags:
                 lines.append("  1. Run: aget init")
 
-            if "No session protocol" in str(self.warnings):
+            if 'no_session_protocol' in self._flags:
                 lines.append("  2. Run: aget apply session/wake")
 
-            if "No patterns/ directory" in str(self.warnings):
+            if 'no_patterns_dir' in self._flags:
                 lines.append("  3. Run: aget apply --list")
 
-            if "@aget-version" in str(self.warnings):
+            if 'no_version_tag' in self._flags:
                 lines.append("  4. Add @aget-version tag to AGENTS.md")
 
         else:
@@ -320,12 +519,17 @@ def main():
         action='store_true',
         help='Treat warnings as errors'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Revalidate every pattern, ignoring .aget/cache/validate.json'
+    )
 
     args = parser.parse_args()
 
     # Run validation
     project_path = Path(args.path)
-    validator = ProjectValidator(project_path)
+    validator = ProjectValidator(project_path, use_cache=not args.no_cache)
     is_valid = validator.validate_all()
 
     # Handle strict mode
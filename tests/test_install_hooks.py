@@ -0,0 +1,59 @@
+"""
+Tests for the smart pre-push hook's change classification
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.install_hooks import HOOK_PHASES
+
+
+def _load_smart_hook():
+    """Namespace of the smart hook program, without running its main()"""
+    namespace = {'__name__': 'smart_pre_push'}
+    exec(compile(HOOK_PHASES['smart'], 'pre-push', 'exec'), namespace)
+    return namespace
+
+
+def test_smart_hook_selects_tests_per_area():
+    """Each changed area adds its tests, in a fixed order, once"""
+    hook = _load_smart_hook()
+    changed = "\n".join([
+        "scripts/aget_session_protocol.py",
+        "aget/config/commands/init.py",
+        "aget/__main__.py",
+        "installer/installer.py",
+        "README.md",
+    ])
+    assert hook['select_tests'](changed) == [
+        'tests/test_gate2_features.py',
+        'tests/test_installer.py',
+        'tests/test_enhanced_installer.py',
+        'tests/test_session_protocol.py',
+    ]
+
+
+def test_smart_hook_ignores_unrelated_changes():
+    """Docs-only changes select no tests"""
+    hook = _load_smart_hook()
+    assert hook['select_tests']("README.md\ndocs/guide.md\n") == []
+
+
+def test_smart_hook_matches_only_top_level_dirs():
+    """aget/ and patterns/ only count at the start of a path"""
+    hook = _load_smart_hook()
+    assert hook['select_tests']("docs/aget/notes.md\nexamples/patterns/x.py") == []
+
+
+def test_smart_hook_finds_overlapping_areas_on_one_line():
+    """One path can select several areas, even where their matches overlap"""
+    hook = _load_smart_hook()
+    tests = hook['select_tests']("session/install.sh/protocol.py")
+    assert tests == [
+        'tests/test_installer.py',
+        'tests/test_enhanced_installer.py',
+        'tests/test_session_protocol.py',
+    ]
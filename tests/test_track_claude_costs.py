@@ -0,0 +1,56 @@
+"""
+Tests for the incremental cost index in track_claude_costs
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.track_claude_costs import ClaudeCostTracker
+
+
+def _write_log(tracker, costs):
+    """Replace the cost log with one entry per cost"""
+    tracker.cost_log_file.write_text(
+        ''.join(json.dumps({'total_cost': cost}) + '\n' for cost in costs))
+
+
+def test_index_follows_appends(tmp_path):
+    """Saved entries and appends by other writers are both counted"""
+    tracker = ClaudeCostTracker(tmp_path)
+    tracker.save_cost_entry({'total_cost': 1.0})
+    tracker.save_cost_entry({'total_cost': 2.0})
+    assert tracker.get_cumulative_cost() == 3.0
+
+    with open(tracker.cost_log_file, 'a') as f:
+        f.write(json.dumps({'total_cost': 0.5}) + '\n')
+    assert tracker.get_cumulative_cost() == 3.5
+    tracker.close()
+
+
+def test_index_rebuilt_when_log_rewritten_larger(tmp_path):
+    """A log replaced by different, longer content is summed from scratch"""
+    tracker = ClaudeCostTracker(tmp_path)
+    tracker.save_cost_entry({'total_cost': 1.0})
+    tracker.save_cost_entry({'total_cost': 2.0})
+    tracker.close()
+    assert tracker.get_cumulative_cost() == 3.0
+
+    _write_log(tracker, [10.0, 10.0, 10.0])
+    assert tracker.get_cumulative_cost() == 30.0
+
+
+def test_index_rebuilt_when_log_replaced(tmp_path):
+    """A log swapped for a new file (as git checkout does) is summed from scratch"""
+    tracker = ClaudeCostTracker(tmp_path)
+    _write_log(tracker, [1.0, 2.0])
+    assert tracker.get_cumulative_cost() == 3.0
+
+    replacement = tmp_path / 'replacement.jsonl'
+    replacement.write_text(
+        ''.join(json.dumps({'total_cost': cost}) + '\n' for cost in [4.0, 4.0, 4.0]))
+    replacement.replace(tracker.cost_log_file)
+    assert tracker.get_cumulative_cost() == 12.0
@@ -0,0 +1,174 @@
+"""
+Tests for pattern validation caching and AST entry-point detection.
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.aget.commands import validate
+from src.aget.commands.validate import CACHE_FILE, PatternValidator, ProjectValidator
+
+NO_ENTRY_POINT = "Pattern has no main() or run() entry point"
+
+
+class TestPatternCache(unittest.TestCase):
+    """Cache hits, misses and version bumps for PatternValidator."""
+
+    def setUp(self):
+        self.project = Path(tempfile.mkdtemp())
+        (self.project / '.aget').mkdir()
+        (self.project / 'patterns').mkdir()
+        self.pattern = self.project / 'patterns' / 'sample.py'
+        self.pattern.write_text('def helper():\n    pass\n')
+
+    def tearDown(self):
+        shutil.rmtree(self.project)
+
+    def _run(self, **kwargs):
+        validator = ProjectValidator(self.project, **kwargs)
+        validator.validate_patterns()
+        return validator
+
+    def _cache(self):
+        return json.loads((self.project / CACHE_FILE).read_text())
+
+    def _poison_cache(self, **changes):
+        """Store a sentinel warning (and changes) so a replay is visible."""
+        cache = self._cache()
+        entry = cache['patterns/sample.py']
+        entry['warnings'] = ['from cache']
+        entry.update(changes)
+        (self.project / CACHE_FILE).write_text(json.dumps(cache))
+
+    def test_first_run_writes_cache(self):
+        """A fresh run validates the pattern and records its result."""
+        validator = self._run()
+        self.assertEqual(validator.warnings, [f"Pattern sample: {NO_ENTRY_POINT}"])
+        entry = self._cache()['patterns/sample.py']
+        self.assertEqual(entry['version'], validate.CACHE_VERSION)
+        self.assertEqual(entry['warnings'], [NO_ENTRY_POINT])
+
+    def test_unchanged_pattern_replays_cache(self):
+        """Same contents and version: the stored result is reused."""
+        self._run()
+        self._poison_cache()
+        self.assertEqual(self._run().warnings, ["Pattern sample: from cache"])
+
+    def test_changed_pattern_is_revalidated(self):
+        """Different contents miss the cache and are checked again."""
+        self._run()
+        self._poison_cache()
+        self.pattern.write_text('def main():\n    pass\n')
+        self.assertEqual(self._run().warnings, [])
+        self.assertEqual(self._cache()['patterns/sample.py']['warnings'], [])
+
+    def test_version_bump_invalidates_cache(self):
+        """Entries from another CACHE_VERSION are recomputed."""
+        self._run()
+        self._poison_cache(version=validate.CACHE_VERSION - 1)
+        self.assertEqual(self._run().warnings, [f"Pattern sample: {NO_ENTRY_POINT}"])
+
+    def test_cache_hits_skip_the_pool(self):
+        """Fully cached runs validate nothing, so no process pool is started."""
+        self._run()
+        with patch.object(validate, 'MIN_PARALLEL_PATTERNS', 1), \
+                patch.object(validate, 'ProcessPoolExecutor') as pool:
+            self.assertEqual(self._run().warnings, [f"Pattern sample: {NO_ENTRY_POINT}"])
+        pool.assert_not_called()
+
+    def test_no_cache_ignores_and_keeps_cache(self):
+        """use_cache=False neither replays nor rewrites the cache."""
+        self._run()
+        self._poison_cache()
+        self.assertEqual(self._run(use_cache=False).warnings,
+                         [f"Pattern sample: {NO_ENTRY_POINT}"])
+        self.assertEqual(self._cache()['patterns/sample.py']['warnings'], ['from cache'])
+
+
+class TestEntryPointDetection(unittest.TestCase):
+    """Entry points are found from the AST without importing the pattern."""
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def _validate(self, source):
+        path = self.tmp / 'pattern.py'
+        path.write_text(source)
+        validator = PatternValidator(path)
+        return validator.validate(), validator.errors, validator.warnings
+
+    def test_entry_points_found(self):
+        for source in ('def main():\n    pass\n',
+                       'async def run():\n    pass\n',
+                       'class Pattern:\n    def run(self):\n        pass\n'):
+            self.assertEqual(self._validate(source), (True, [], []), source)
+
+    def test_pattern_is_not_executed(self):
+        """Top-level code (here, a failing import) never runs."""
+        ok, errors, warnings = self._validate(
+            'import module_that_does_not_exist\n\ndef main():\n    pass\n')
+        self.assertTrue(ok)
+        self.assertEqual(errors, [])
+
+    def test_missing_entry_point_warns(self):
+        ok, _, warnings = self._validate('def helper():\n    pass\n')
+        self.assertTrue(ok)
+        self.assertEqual(warnings, [NO_ENTRY_POINT])
+
+    def test_syntax_error_reported(self):
+        ok, errors, _ = self._validate('def main(:\n')
+        self.assertFalse(ok)
+        self.assertTrue(errors[0].startswith("Syntax error:"))
+
+
+class TestPatternWalk(unittest.TestCase):
+    """patterns/ trees that can't be listed are skipped, not fatal."""
+
+    def setUp(self):
+        self.project = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.project)
+
+    def test_patterns_file_not_directory(self):
+        """A regular file named patterns yields no patterns."""
+        (self.project / 'patterns').write_text('not a directory\n')
+        validator = ProjectValidator(self.project, use_cache=False)
+        self.assertTrue(validator.validate_patterns())
+        self.assertEqual((validator.checks_total, validator.errors), (0, []))
+
+    def test_unreadable_subdirectory_skipped(self):
+        """A subdirectory that can't be listed is skipped; its siblings are checked."""
+        patterns = self.project / 'patterns'
+        (patterns / 'locked').mkdir(parents=True)
+        (patterns / 'locked' / 'hidden.py').write_text('def main():\n    pass\n')
+        (patterns / 'open.py').write_text('def main():\n    pass\n')
+        locked = str(patterns / 'locked')
+        real_scandir = validate.os.scandir
+
+        def scandir(path):
+            if os.fspath(path) == locked:
+                raise PermissionError(13, 'Permission denied', locked)
+            return real_scandir(path)
+
+        validator = ProjectValidator(self.project, use_cache=False)
+        with patch.object(validate.os, 'scandir', side_effect=scandir):
+            self.assertTrue(validator.validate_patterns())
+        self.assertEqual(validator.checks_total, 1)
+        self.assertEqual(validator.errors, [])
+
+
+if __name__ == "__main__":
+    unittest.main()